@@ -3,34 +3,45 @@ Main ETL Pipeline module implementing SOLID principles.
 This module orchestrates the Extract, Transform, and Load operations.
 """
 
+import logging
+from typing import Dict, Iterator, Optional
+
 import pandas as pd
 from utils.extract import HttpContentFetcher, RegexTextExtractor, FashionProductParser, FashionDataExtractor
-from utils.transform import FashionDataTransformer
+from utils.transform import FashionDataTransformer, DtypeOptimizer
 from utils.load import MultiDestinationDataLoader
+from utils.config import PRODUCT_COLUMNS, LOGGING_CONFIG
 
 
 class ETLPipeline:
     """Main ETL Pipeline class following Single Responsibility Principle."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        # Diagnostic DataFrame summaries are only printed in verbose mode
+        self.verbose = verbose
+        
         # Initialize components following Dependency Injection
         self.content_fetcher = HttpContentFetcher()
         self.text_extractor = RegexTextExtractor()
         self.product_parser = FashionProductParser(self.text_extractor)
         self.data_extractor = FashionDataExtractor(self.content_fetcher, self.product_parser)
         self.data_transformer = FashionDataTransformer()
+        self.dtype_optimizer = DtypeOptimizer()
         self.data_loader = MultiDestinationDataLoader()
     
     def extract_data(self, total_pages: int = 50) -> pd.DataFrame:
         """Extract data from the source."""
         print("Starting data extraction process...")
-        extracted_data = self.data_extractor.extract(total_pages=total_pages)
+        products = self.data_extractor.iter_extract(total_pages=total_pages)
+        
+        # Products are tuples, so they are consumed as records as they stream
+        # in; explicit columns skip schema inference
+        df_raw = pd.DataFrame.from_records(products, columns=PRODUCT_COLUMNS)
         
-        if not extracted_data:
+        if df_raw.empty:
             print("No data was successfully extracted. Process stopped.")
             return pd.DataFrame()
         
-        df_raw = pd.DataFrame(extracted_data)
         print(f"Extraction completed. Number of records: {len(df_raw)}")
         return df_raw
     
@@ -39,23 +50,33 @@ class ETLPipeline:
         if df_raw.empty:
             return df_raw
         
-        print("\n=======Data Information Before Transformation:=======")
-        print(df_raw.info())
-        print("\n=======Data Head Before Transformation:=======")
-        print(df_raw.head())
+        if self.verbose:
+            self._describe(df_raw, "Before Transformation")
         
         print("\nStarting data transformation process...")
         df_cleaned = self.data_transformer.transform(df_raw)
         print(f"Transformation completed. Number of records after cleaning: {len(df_cleaned)}")
         
         if not df_cleaned.empty:
-            print("\n=======Data Information After Transformation:=======")
-            print(df_cleaned.info())
-            print("\n=======Data Head After Transformation:=======")
-            print(df_cleaned.head())
+            if self.verbose:
+                memory_before = df_cleaned.memory_usage(deep=True).sum()
+            df_cleaned = self.dtype_optimizer.optimize(df_cleaned)
+            
+            if self.verbose:
+                memory_after = df_cleaned.memory_usage(deep=True).sum()
+                print(f"Memory usage after dtype optimization: {memory_before} -> {memory_after} bytes")
+                self._describe(df_cleaned, "After Transformation")
         
         return df_cleaned
     
+    @staticmethod
+    def _describe(df: pd.DataFrame, stage: str) -> None:
+        """Print DataFrame info and head for diagnostics."""
+        print(f"\n=======Data Information {stage}:=======")
+        df.info()
+        print(f"\n=======Data Head {stage}:=======")
+        print(df.head())
+    
     def load_data(self, df_cleaned: pd.DataFrame) -> None:
         """Load data to storage destinations."""
         if df_cleaned.empty:
@@ -65,15 +86,23 @@ class ETLPipeline:
         print("\nStarting data loading process to storage (CSV, PostgreSQL, Google Sheets)...")
         results = self.data_loader.load_to_all(df_cleaned)
         
-        # Report results
-        success_count = sum(results.values())
-        total_destinations = len(results)
-        
-        print(f"Loading completed. {success_count}/{total_destinations} destinations successful.")
+        self._report_results(results)
+    
+    @staticmethod
+    def _report_results(results: Dict[str, Optional[bool]]) -> None:
+        """Print how many enabled destinations were loaded successfully."""
+        enabled = {destination: success for destination, success in results.items() if success is not None}
+        success_count = sum(1 for success in enabled.values() if success)
+        total_destinations = len(enabled)
         
+        lines = [f"Loading completed. {success_count}/{total_destinations} destinations successful."]
         for destination, success in results.items():
-            status = "✓" if success else "✗"
-            print(f"  {status} {destination}")
+            if success is None:
+                lines.append(f"  - {destination} (disabled)")
+            else:
+                lines.append(f"  {'✓' if success else '✗'} {destination}")
+        # One write instead of one per destination
+        print("\n".join(lines))
     
     def run(self, total_pages: int = 50) -> None:
         """Run the complete ETL pipeline."""
@@ -92,9 +121,41 @@ class ETLPipeline:
         except Exception as e:
             print(f"Error in main ETL process: {e}")
 
+    
+    def iter_cleaned_batches(self, total_pages: int = 50) -> Iterator[pd.DataFrame]:
+        """Extract and transform the source one page at a time."""
+        for products in self.data_extractor.iter_pages(total_pages=total_pages):
+            df_raw = pd.DataFrame.from_records(products, columns=PRODUCT_COLUMNS)
+            df_cleaned = self.data_transformer.transform(df_raw)
+            if not df_cleaned.empty:
+                yield self.dtype_optimizer.optimize(df_cleaned)
+    
+    def run_streaming(self, total_pages: int = 50) -> None:
+        """Run the pipeline page by page instead of materializing every stage.
+        
+        Each page is transformed and appended to CSV and PostgreSQL as soon as
+        it is scraped, while the extractor's worker pool keeps fetching the
+        following pages. Only cleaned rows are held for the final Google
+        Sheets write.
+        """
+        try:
+            print("Starting streaming ETL process...")
+            results = self.data_loader.load_batches(self.iter_cleaned_batches(total_pages))
+            
+            if not results:
+                print("No data to load.")
+                return
+            
+            self._report_results(results)
+            print("\nETL process completed successfully.")
+            
+        except Exception as e:
+            print(f"Error in streaming ETL process: {e}")
+
 
 def main():
     """Main function to run the ETL pipeline."""
+    logging.basicConfig(**LOGGING_CONFIG)
     pipeline = ETLPipeline()
     pipeline.run(total_pages=50)
 
@@ -16,16 +16,21 @@ from utils.extract import (
     RegexTextExtractor,
     FashionProductParser,
     FashionDataExtractor,
+    RateLimiter,
     fetching_content,
     extract_clean_text,
     extract_product_data,
     scrape_fashion_products
 )
-from utils.config import HEADERS
+from utils.config import HEADERS, HTTP_CONFIG, COMPILED_EXTRACTION_PATTERNS
+from utils.interfaces import TextExtractorInterface
+from utils.models import Product
 from bs4 import BeautifulSoup
 from datetime import datetime
+import re
 import requests
 import time
+import urllib3
 
 
 class TestHttpContentFetcher(unittest.TestCase):
@@ -34,32 +39,54 @@ class TestHttpContentFetcher(unittest.TestCase):
     def setUp(self):
         self.fetcher = HttpContentFetcher()
     
-    @patch('utils.extract.requests.get')
+    @patch('utils.extract.requests.Session.get')
     def test_fetch_returns_content_on_success(self, mock_get):
         """Test that fetch returns content on successful HTTP response."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b"<html><body>Test Content</body></html>"
-        mock_get.return_value = mock_response
+        mock_response.raw.read.return_value = b"<html><body>Test Content</body></html>"
+        mock_get.return_value.__enter__.return_value = mock_response
         
         url = "http://example.com"
         content = self.fetcher.fetch(url)
         
         self.assertEqual(content, b"<html><body>Test Content</body></html>")
-        mock_get.assert_called_once_with(url, headers=HEADERS)
+        mock_get.assert_called_once_with(url, stream=True, timeout=HTTP_CONFIG["timeout"])
+        mock_response.raw.read.assert_called_once_with(decode_content=True)
     
-    @patch('utils.extract.requests.get')
+    @patch('utils.extract.requests.Session.get')
     def test_fetch_returns_none_on_failure(self, mock_get):
         """Test that fetch returns None on HTTP request failure."""
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = requests.exceptions.RequestException("HTTP Error")
-        mock_get.return_value = mock_response
+        mock_get.return_value.__enter__.return_value = mock_response
         
         url = "http://example.com/error"
         content = self.fetcher.fetch(url)
         
         self.assertIsNone(content)
-        mock_get.assert_called_once_with(url, headers=HEADERS)
+        mock_get.assert_called_once_with(url, stream=True, timeout=HTTP_CONFIG["timeout"])
+    
+    @patch('utils.extract.requests.Session.get')
+    def test_fetch_returns_none_when_body_read_fails(self, mock_get):
+        """Test that a connection dropped while streaming the body counts as a failure."""
+        mock_response = MagicMock()
+        mock_response.raw.read.side_effect = urllib3.exceptions.ProtocolError("Connection broken")
+        mock_get.return_value.__enter__.return_value = mock_response
+        
+        self.assertIsNone(self.fetcher.fetch("http://example.com/broken"))
+    
+    def test_session_sends_configured_headers(self):
+        """Test that the pooled session carries the fetcher's headers."""
+        self.assertEqual(self.fetcher.session.headers["User-Agent"], HEADERS["User-Agent"])
+    
+    def test_session_retries_transient_failures(self):
+        """Test that the mounted adapters retry configured statuses with backoff."""
+        for prefix in ("https://", "http://"):
+            retry = self.fetcher.session.get_adapter(prefix).max_retries
+            self.assertEqual(retry.total, HTTP_CONFIG["retries"])
+            self.assertEqual(retry.backoff_factor, HTTP_CONFIG["backoff_factor"])
+            self.assertEqual(set(retry.status_forcelist), set(HTTP_CONFIG["status_forcelist"]))
 
 
 class TestRegexTextExtractor(unittest.TestCase):
@@ -104,6 +131,109 @@ class TestRegexTextExtractor(unittest.TestCase):
         
         result = self.extractor.extract_text(info_list, keyword, pattern, default_value)
         self.assertEqual(result, "Not Found")
+    
+    def test_extract_text_compiles_pattern_once(self):
+        """Test that a pattern is compiled on first use and reused afterwards."""
+        info_list = [MagicMock(string="Brand: Acme")]
+        pattern = r"Brand:\s*(\w+)"
+        
+        with patch('utils.extract.re.compile', wraps=re.compile) as mock_compile:
+            self.extractor.extract_text(info_list, "Brand", pattern)
+            result = self.extractor.extract_text(info_list, "Brand", pattern)
+        
+        self.assertEqual(result, "Acme")
+        mock_compile.assert_called_once_with(pattern)
+    
+    def test_extract_text_accepts_compiled_pattern(self):
+        """Test that precompiled patterns are used as they are."""
+        info_list = [MagicMock(string="Size: XL")]
+        
+        with patch('utils.extract.re.compile') as mock_compile:
+            result = self.extractor.extract_text(
+                info_list, "Size", COMPILED_EXTRACTION_PATTERNS["size"]
+            )
+        
+        self.assertEqual(result, "XL")
+        mock_compile.assert_not_called()
+    
+    def test_extract_fields_single_pass(self):
+        """Test that extract_fields fills every matched field and defaults the rest."""
+        info_list = [
+            MagicMock(string="Rating: ⭐ 4.5"),
+            MagicMock(string=None),
+            MagicMock(string="3 Colors"),
+            MagicMock(string="Size: XL"),
+        ]
+        patterns = {
+            "rating": r"Rating:\s*(⭐\s*\d+(?:\.\d+)?)",
+            "colors": r"(\d+)\s*Colors",
+            "size": r"Size:\s*(\w+)",
+            "gender": r"Gender:\s*(\w+)",
+        }
+        defaults = {"rating": "-", "colors": "-", "size": "-", "gender": "Unknown"}
+        
+        result = self.extractor.extract_fields(info_list, patterns, defaults)
+        
+        self.assertEqual(result, {"rating": "⭐ 4.5", "colors": "3", "size": "XL", "gender": "Unknown"})
+    
+    def test_extract_fields_dispatches_by_keyword(self):
+        """Test that only elements containing a field's keyword are matched for it."""
+        info_list = [
+            MagicMock(string="Gender: Men"),
+            MagicMock(string="Fit: Slim"),
+            MagicMock(string="Fit: Regular"),
+        ]
+        patterns = {"fit": r"Fit:\s*(\w+)", "gender": r"Gender:\s*(\w+)"}
+        defaults = {"fit": "-", "gender": "-"}
+        
+        result = self.extractor.extract_fields(
+            info_list, patterns, defaults, keywords={"fit": "Fit", "gender": "Gender"}
+        )
+        
+        self.assertEqual(result, {"fit": "Slim", "gender": "Men"})
+    
+    def test_interface_default_extract_fields(self):
+        """Test that extractors implementing only extract_text get a working extract_fields."""
+        class FirstMatchExtractor(TextExtractorInterface):
+            def extract_text(self, elements, keyword, pattern, default="N/A"):
+                for element in elements:
+                    match = re.search(pattern, element.string) if keyword in element.string else None
+                    if match:
+                        return match.group(1)
+                return default
+        
+        info_list = [MagicMock(string="Size: M"), MagicMock(string="Gender: Men")]
+        patterns = {"size": r"Size:\s*(\w+)", "gender": r"Gender:\s*(\w+)", "colors": r"(\d+)\s*Colors"}
+        defaults = {"size": "-", "gender": "-", "colors": "0"}
+        
+        result = FirstMatchExtractor().extract_fields(info_list, patterns, defaults)
+        
+        self.assertEqual(result, {"size": "M", "gender": "Men", "colors": "0"})
+    
+    def test_extract_fields_strips_like_extract_text(self):
+        """Test that extract_fields and extract_text return the same stripped value."""
+        info_list = [MagicMock(string="Size:  XL  ")]
+        pattern = r"Size:(.+)"
+        
+        result = self.extractor.extract_fields(info_list, {"size": pattern}, {"size": "-"})
+        
+        self.assertEqual(result, {"size": "XL"})
+        self.assertEqual(self.extractor.extract_text(info_list, "Size", pattern), "XL")
+        default = TextExtractorInterface.extract_fields(self.extractor, info_list, {"size": pattern}, {"size": "-"})
+        self.assertEqual(default, result)
+    
+    def test_extract_fields_several_in_one_element(self):
+        """Test that one element can fill several fields, as extract_text would."""
+        info_list = [MagicMock(string="Size: M | Gender: Men")]
+        patterns = {"size": r"Size:\s*(\w+)", "gender": r"Gender:\s*(\w+)"}
+        defaults = {"size": "-", "gender": "Unknown"}
+        
+        result = self.extractor.extract_fields(info_list, patterns, defaults)
+        
+        self.assertEqual(result, {"size": "M", "gender": "Men"})
+        self.assertEqual(
+            self.extractor.extract_text(info_list, "Gender", patterns["gender"]), result["gender"]
+        )
 
 
 class TestFashionProductParser(unittest.TestCase):
@@ -140,6 +270,11 @@ class TestFashionProductParser(unittest.TestCase):
         self.assertEqual(product_data['Size'], "L")
         self.assertEqual(product_data['Gender'], "Female")
         self.assertIsInstance(product_data['Timestamp'], datetime)
+        self.assertIsInstance(product_data, Product)
+        self.assertEqual(product_data.Title, "Test Product")
+        self.assertEqual(product_data[:2], ("Test Product", "$25.00"))
+        self.assertIsInstance(product_data, tuple)
+        self.assertEqual(product_data[1], "$25.00")
     
     def test_parse_handles_missing_elements(self):
         """Test that parse handles missing HTML elements gracefully."""
@@ -164,6 +299,19 @@ class TestFashionProductParser(unittest.TestCase):
         self.assertEqual(product_data['Gender'], "Unknown")
         self.assertIsInstance(product_data['Timestamp'], datetime)
     
+    def test_parser_instances_have_no_dict(self):
+        """Test that the per-card helpers use fixed slots instead of an instance dict."""
+        for instance in (self.parser, self.text_extractor, HttpContentFetcher()):
+            self.assertFalse(hasattr(instance, '__dict__'))
+    
+    def test_parse_rating_without_star(self):
+        """Test that a rating written as a bare number is still extracted."""
+        soup = BeautifulSoup('<div class="collection-card"><p>Rating: 4.2 / 5</p></div>', 'html.parser')
+        
+        product_data = self.parser.parse(soup.div)
+        
+        self.assertEqual(product_data['Rating'], "4.2")
+    
     def test_parse_handles_empty_title(self):
         """Test that parse handles products with empty titles."""
         html_content = """
@@ -186,6 +334,21 @@ class TestFashionProductParser(unittest.TestCase):
         self.assertEqual(product_data['Rating'], "⭐ 4.0")
 
 
+class TestRateLimiter(unittest.TestCase):
+    """Tests for RateLimiter class."""
+    
+    @patch('utils.extract.time.sleep')
+    @patch('utils.extract.time.monotonic', return_value=100.0)
+    def test_acquire_spaces_calls_by_interval(self, mock_monotonic, mock_sleep):
+        """Test that the first call runs at once and later ones wait for their slot."""
+        limiter = RateLimiter(0.5)
+        
+        for _ in range(3):
+            limiter.acquire()
+        
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+
+
 class TestFashionDataExtractor(unittest.TestCase):
     """Tests for FashionDataExtractor class."""
     
@@ -214,30 +377,170 @@ class TestFashionDataExtractor(unittest.TestCase):
             self.assertEqual(data[0]['Title'], "Test")
             self.content_fetcher.fetch.assert_called_once()
             self.product_parser.parse.assert_called_once()
-            mock_sleep.assert_called_once_with(0.1)
+            mock_sleep.assert_not_called()
 
+    @patch('utils.extract.time.sleep')
+    def test_extract_skips_parsing_pages_without_cards(self, mock_sleep):
+        """Test that pages without any product card are never handed to BeautifulSoup."""
+        self.content_fetcher.fetch.return_value = b"<html><body><p>Maintenance</p></body></html>"
+        
+        with patch('utils.extract.BeautifulSoup') as mock_soup_class:
+            data = self.extractor.extract(total_pages=1, delay=0)
+        
+        self.assertEqual(data, [])
+        mock_soup_class.assert_not_called()
+        self.product_parser.parse.assert_not_called()
+
+    @patch('utils.extract.time.sleep')
+    def test_extract_stops_at_first_failed_page(self, mock_sleep):
+        """Test that pages after a failed fetch are discarded and page order is kept."""
+        pages = {
+            "https://fashion-studio.dicoding.dev/": b'<div class="collection-card">1</div>',
+            "https://fashion-studio.dicoding.dev/page2": None,
+            "https://fashion-studio.dicoding.dev/page3": b'<div class="collection-card">3</div>',
+        }
+        self.content_fetcher.fetch.side_effect = lambda url: pages[url]
+        self.product_parser.parse.side_effect = lambda card, timestamp: {"Title": card.text}
+
+        data = self.extractor.extract(total_pages=3, delay=0, max_workers=3)
+
+        self.assertEqual(data, [{"Title": "1"}])
+
+    @patch('utils.extract.time.sleep')
+    def test_extract_parses_only_product_cards(self, mock_sleep):
+        """Test that cards are found on a full page and parsed with their contents."""
+        self.content_fetcher.fetch.return_value = """
+            <html><head><title>Fashion Studio</title></head><body>
+                <nav><p>Rating: ⭐ 1.0</p></nav>
+                <div class="collection-card featured">
+                    <div class="product-details"><h3 class="product-title">Hoodie 3</h3></div>
+                    <div class="price-container">$496.88</div>
+                    <p>Rating: ⭐ 4.8 / 5</p>
+                </div>
+            </body></html>
+        """.encode("utf-8")
+        extractor = FashionDataExtractor(self.content_fetcher, FashionProductParser(RegexTextExtractor()))
+
+        data = extractor.extract(total_pages=1, delay=0)
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['Title'], "Hoodie 3")
+        self.assertEqual(data[0]['Rating'], "⭐ 4.8")
+
+    @patch('utils.extract.time.sleep')
+    def test_extract_stamps_cards_of_a_page_once(self, mock_sleep):
+        """Test that every card on a page shares the page's timestamp."""
+        self.content_fetcher.fetch.return_value = b'<div class="collection-card">A</div>' * 3
+        extractor = FashionDataExtractor(self.content_fetcher, FashionProductParser(RegexTextExtractor()))
+
+        with patch('utils.extract.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 1)
+            data = extractor.extract(total_pages=1, delay=0)
+
+        self.assertEqual(len(data), 3)
+        mock_datetime.now.assert_called_once()
+        self.assertTrue(all(product['Timestamp'] == datetime(2024, 1, 1) for product in data))
+
+    @patch('utils.extract.time.sleep')
+    def test_extract_skips_cards_that_fail_to_parse(self, mock_sleep):
+        """Test that an error in one card is reported without losing the rest of the page."""
+        self.content_fetcher.fetch.return_value = (
+            b'<div class="collection-card">bad</div><div class="collection-card">good</div>'
+        )
+
+        def parse(card, timestamp):
+            if card.text == "bad":
+                raise AttributeError("unexpected markup")
+            return {"Title": card.text}
+
+        self.product_parser.parse.side_effect = parse
+
+        with self.assertLogs('utils.extract', level='WARNING') as logs:
+            data = self.extractor.extract(total_pages=1, delay=0)
+
+        self.assertEqual(data, [{"Title": "good"}])
+        self.assertIn("Error extracting product on page 1: unexpected markup", logs.output[0])
+
+    def test_iter_extract_yields_products_lazily(self):
+        """Test that products are yielded one by one without building a list."""
+        self.extractor.iter_pages = MagicMock(return_value=iter([["a", "b"], ["c"]]))
+        
+        products = self.extractor.iter_extract(total_pages=2)
+        
+        self.assertNotIsInstance(products, list)
+        self.assertEqual(list(products), ["a", "b", "c"])
+        self.extractor.iter_pages.assert_called_once_with(total_pages=2)
+
+    def test_iter_pages_bounded_and_cancelled_on_close(self):
+        """Test that fetching runs at most max_workers pages ahead and stops when closed early."""
+        fetched = []
+        
+        def slow_fetch(url):
+            fetched.append(url)
+            time.sleep(0.05)
+            return b'<div class="collection-card"></div>'
+        
+        self.content_fetcher.fetch.side_effect = slow_fetch
+        self.product_parser.parse.return_value = {"Title": "A"}
+        pages = self.extractor.iter_pages(total_pages=50, delay=0, max_workers=2)
+        
+        self.assertEqual(next(pages), [{"Title": "A"}])
+        started = time.monotonic()
+        pages.close()
+        
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertLessEqual(len(fetched), 4)
+    
+    def test_extract_with_parse_processes(self):
+        """Test that pages parsed in worker processes come back in page order."""
+        pages = {
+            "https://fashion-studio.dicoding.dev/": b'<div class="collection-card"><div class="product-details"><h3 class="product-title">A</h3></div></div>',
+            "https://fashion-studio.dicoding.dev/page2": b'<div class="collection-card"><div class="product-details"><h3 class="product-title">B</h3></div></div>',
+        }
+        self.content_fetcher.fetch.side_effect = lambda url: pages[url]
+        extractor = FashionDataExtractor(self.content_fetcher, FashionProductParser(RegexTextExtractor()))
+        
+        data = extractor.extract(total_pages=2, delay=0, parse_processes=2)
+        
+        self.assertEqual([product['Title'] for product in data], ["A", "B"])
+
+    
+    def test_parse_processes_stream_pages(self):
+        """Test that process parsing yields the first page before the rest are fetched."""
+        fetched = []
+        
+        def slow_fetch(url):
+            fetched.append(url)
+            time.sleep(0.05)
+            return b'<div class="collection-card"><div class="product-details"><h3 class="product-title">A</h3></div></div>'
+        
+        self.content_fetcher.fetch.side_effect = slow_fetch
+        extractor = FashionDataExtractor(self.content_fetcher, FashionProductParser(RegexTextExtractor()))
+        pages = extractor.iter_pages(total_pages=20, delay=0, max_workers=2, parse_processes=1)
+        
+        first = next(pages)
+        pages.close()
+        
+        self.assertEqual(first[0]['Title'], "A")
+        self.assertLess(len(fetched), 20)
 
 class TestLegacyFunctions(unittest.TestCase):
     """Tests for legacy function wrappers."""
     
-    @patch('utils.extract.HttpContentFetcher')
-    def test_fetching_content_legacy_wrapper(self, mock_fetcher_class):
+    @patch('utils.extract._default_fetcher')
+    def test_fetching_content_legacy_wrapper(self, mock_fetcher):
         """Test legacy fetching_content function."""
-        mock_fetcher = MagicMock()
         mock_fetcher.fetch.return_value = b"content"
-        mock_fetcher_class.return_value = mock_fetcher
         
         result = fetching_content("http://test.com")
         
         self.assertEqual(result, b"content")
         mock_fetcher.fetch.assert_called_once_with("http://test.com")
     
-    @patch('utils.extract.RegexTextExtractor')
-    def test_extract_clean_text_legacy_wrapper(self, mock_extractor_class):
+    @patch('utils.extract._default_text_extractor')
+    def test_extract_clean_text_legacy_wrapper(self, mock_extractor):
         """Test legacy extract_clean_text function."""
-        mock_extractor = MagicMock()
         mock_extractor.extract_text.return_value = "extracted_text"
-        mock_extractor_class.return_value = mock_extractor
         
         result = extract_clean_text([], "keyword", "pattern", "default")
         
@@ -3,7 +3,11 @@ Unit tests for data loading module following SOLID principles.
 Tests the new class-based architecture with separate loaders.
 """
 
+import json
+import subprocess
+import threading
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import patch, MagicMock
 import sys
@@ -14,14 +18,29 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from utils.load import (
     CsvDataLoader,
+    ParquetDataLoader,
     PostgreSQLDataLoader,
     GoogleSheetsDataLoader,
     MultiDestinationDataLoader,
     save_to_csv,
     save_to_postgresql,
     save_to_google_spreadsheet,
-    load_data
+    load_data,
+    _get_engine,
+    _get_sheets_service
 )
+from utils.config import get_database_config
+from utils.sheets_model import OrjsonModel
+
+
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    """Drop cached API clients so every test sees its own patched factories."""
+    _get_sheets_service.cache_clear()
+    _get_engine.cache_clear()
+    yield
+    _get_sheets_service.cache_clear()
+    _get_engine.cache_clear()
 
 
 # Fixture DataFrame
@@ -54,6 +73,82 @@ class TestCsvDataLoader:
         assert not df_read.empty
         assert list(df_read.columns) == list(sample_dataframe.columns)
     
+    def test_load_gzip_compressed(self, tmp_path, sample_dataframe):
+        """Test that a .gz filename produces a gzip-compressed CSV."""
+        file_path = tmp_path / "test_fashion.csv.gz"
+        loader = CsvDataLoader()
+        
+        result = loader.load(sample_dataframe, filename=str(file_path), chunksize=1)
+        
+        assert result is True
+        assert file_path.read_bytes()[:2] == b"\x1f\x8b"
+        df_read = pd.read_csv(file_path)
+        assert df_read["Title"].tolist() == ["Item A"]
+    
+    def test_load_append_batches(self, tmp_path, sample_dataframe):
+        """Test that appended batches share a single header row."""
+        file_path = tmp_path / "test_fashion.csv"
+        loader = CsvDataLoader()
+        
+        loader.load(sample_dataframe, filename=str(file_path))
+        loader.load(sample_dataframe, filename=str(file_path), mode='a', header=False)
+        
+        df_read = pd.read_csv(file_path)
+        assert len(df_read) == 2
+        assert list(df_read.columns) == list(sample_dataframe.columns)
+    
+    def test_failed_rewrite_keeps_previous_file(self, tmp_path, sample_dataframe, capsys):
+        """Test that a rewrite goes through a temporary file that is removed on failure."""
+        file_path = tmp_path / "test_fashion.csv"
+        loader = CsvDataLoader()
+        loader.load(sample_dataframe, filename=str(file_path))
+        previous = file_path.read_text()
+        
+        with patch("pandas.DataFrame.to_csv", side_effect=OSError("disk full")):
+            result = loader.load(sample_dataframe, filename=str(file_path))
+        
+        assert result is False
+        assert "[CSV Error]" in capsys.readouterr().out
+        assert file_path.read_text() == previous
+        assert [path.name for path in tmp_path.iterdir()] == ["test_fashion.csv"]
+    
+    def test_load_formats_timestamps(self, tmp_path, sample_dataframe):
+        """Test that datetime columns are written in the ISO timestamp format."""
+        file_path = tmp_path / "test_fashion.csv"
+        data = sample_dataframe.assign(Timestamp=pd.to_datetime(sample_dataframe["Timestamp"]))
+        
+        CsvDataLoader().load(data, filename=str(file_path))
+        
+        df_read = pd.read_csv(file_path)
+        assert df_read["Timestamp"].tolist() == ["2025-05-10T10:00:00.000000"]
+    
+    def test_load_with_pyarrow_engine(self, tmp_path, sample_dataframe):
+        """Test that the pyarrow writer produces the same data, including appends."""
+        pytest.importorskip("pyarrow")
+        file_path = tmp_path / "test_fashion.csv"
+        loader = CsvDataLoader()
+        
+        with patch("pandas.DataFrame.to_csv") as mock_to_csv:
+            loader.load(sample_dataframe, filename=str(file_path), engine="pyarrow")
+            loader.load(sample_dataframe, filename=str(file_path), engine="pyarrow", mode='a', header=False)
+        
+        mock_to_csv.assert_not_called()
+        df_read = pd.read_csv(file_path)
+        # Whole floats are written without ".0", so they read back as integers
+        pd.testing.assert_frame_equal(
+            df_read, pd.concat([sample_dataframe] * 2, ignore_index=True), check_dtype=False
+        )
+    
+    def test_load_pyarrow_engine_falls_back_without_pyarrow(self, tmp_path, sample_dataframe):
+        """Test that pandas writes the file when pyarrow cannot be imported."""
+        file_path = tmp_path / "test_fashion.csv"
+        
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            result = CsvDataLoader().load(sample_dataframe, filename=str(file_path), engine="pyarrow")
+        
+        assert result is True
+        assert file_path.read_text().startswith("Title,Price")
+    
     @patch("pandas.DataFrame.to_csv", side_effect=Exception("Disk full"))
     def test_load_exception(self, mock_to_csv, sample_dataframe, capsys):
         """Test CSV loading exception handling."""
@@ -65,10 +160,32 @@ class TestCsvDataLoader:
         assert "[CSV Error] Failed to save data to CSV: Disk full" in captured.out
 
 
+class TestParquetDataLoader:
+    """Tests for ParquetDataLoader class."""
+    
+    def test_load_success(self, tmp_path, sample_dataframe):
+        """Test that the frame round-trips through a Parquet file."""
+        pytest.importorskip("pyarrow")
+        file_path = tmp_path / "test_fashion.parquet"
+        
+        result = ParquetDataLoader().load(sample_dataframe, filename=str(file_path))
+        
+        assert result is True
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), sample_dataframe)
+    
+    @patch("pandas.DataFrame.to_parquet", side_effect=ImportError("Unable to find a usable engine"))
+    def test_load_exception(self, mock_to_parquet, sample_dataframe, capsys):
+        """Test Parquet loading exception handling."""
+        result = ParquetDataLoader().load(sample_dataframe, filename="test_fashion.parquet")
+        
+        assert result is False
+        assert "[Parquet Error] Failed to save data to Parquet" in capsys.readouterr().out
+
+
 class TestPostgreSQLDataLoader:
     """Tests for PostgreSQLDataLoader class."""
     
-    @patch("utils.load.create_engine")
+    @patch("sqlalchemy.create_engine")
     def test_load_success(self, mock_create_engine, sample_dataframe):
         """Test successful PostgreSQL loading."""
         mock_engine = MagicMock()
@@ -81,15 +198,129 @@ class TestPostgreSQLDataLoader:
                 sample_dataframe,
                 db_name="test_db",
                 user="user",
-                password="password"
+                password="password",
+                use_copy=False
             )
             
             assert result is True
             mock_to_sql.assert_called_once_with(
-                "fashion_products", mock_engine, index=False, if_exists="append"
+                "fashion_products", mock_engine, index=False, if_exists="append",
+                method="multi", chunksize=1000
+            )
+    
+    @patch("sqlalchemy.create_engine")
+    def test_load_lowercases_extra_columns(self, mock_create_engine, sample_dataframe):
+        """Test that columns outside the product schema are lowercased too."""
+        mock_engine = MagicMock()
+        mock_engine.dialect.name = "postgresql"
+        mock_create_engine.return_value = mock_engine
+        mock_cursor = mock_engine.raw_connection.return_value.cursor.return_value.__enter__.return_value
+        
+        with patch("pandas.DataFrame.to_sql"):
+            result = PostgreSQLDataLoader().load(
+                sample_dataframe.assign(Discount=0.1), db_name="test_db", user="user", password="password"
+            )
+        
+        assert result is True
+        statement = mock_cursor.copy_expert.call_args.args[0]
+        assert "timestamp, discount)" in statement
+    
+    @patch("psycopg2.extras.execute_values")
+    @patch("sqlalchemy.create_engine")
+    def test_load_with_execute_values(self, mock_create_engine, mock_execute_values, sample_dataframe):
+        """Test that use_copy=False on psycopg2 inserts rows with execute_values."""
+        mock_engine = MagicMock()
+        mock_engine.dialect.name = "postgresql"
+        mock_engine.dialect.driver = "psycopg2"
+        mock_create_engine.return_value = mock_engine
+        mock_connection = mock_engine.raw_connection.return_value
+        data = pd.concat([sample_dataframe, sample_dataframe.assign(Rating=np.nan)], ignore_index=True)
+        
+        with patch("pandas.DataFrame.to_sql") as mock_to_sql:
+            result = PostgreSQLDataLoader().load(
+                data, db_name="test_db", user="user", password="password", use_copy=False
+            )
+        
+        assert result is True
+        mock_to_sql.assert_called_once_with(
+            "fashion_products", mock_engine, index=False, if_exists="append"
+        )
+        _, statement, rows = mock_execute_values.call_args.args
+        assert statement == (
+            "INSERT INTO fashion_products (title, price, rating, colors, size, gender, timestamp) VALUES %s"
+        )
+        assert rows[0] == ("Item A", 160000.0, 4.5, 3, "M", "Male", "2025-05-10T10:00:00.000000")
+        assert rows[1][2] is None
+        assert mock_execute_values.call_args.kwargs["page_size"] == 1000
+        mock_connection.commit.assert_called_once()
+        mock_connection.close.assert_called_once()
+    
+    @patch("sqlalchemy.create_engine")
+    def test_load_with_copy(self, mock_create_engine, sample_dataframe):
+        """Test PostgreSQL loading through COPY FROM STDIN."""
+        mock_engine = MagicMock()
+        mock_engine.dialect.name = "postgresql"
+        mock_create_engine.return_value = mock_engine
+        mock_connection = mock_engine.raw_connection.return_value
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        loader = PostgreSQLDataLoader()
+        
+        with patch("pandas.DataFrame.to_sql") as mock_to_sql:
+            result = loader.load(
+                sample_dataframe,
+                db_name="test_db",
+                user="user",
+                password="password"
             )
+        
+        assert result is True
+        # Only the empty schema frame goes through to_sql
+        mock_to_sql.assert_called_once_with(
+            "fashion_products", mock_engine, index=False, if_exists="append"
+        )
+        statement, buffer = mock_cursor.copy_expert.call_args.args
+        assert statement == (
+            "COPY fashion_products (title, price, rating, colors, size, gender, timestamp) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        assert buffer.getvalue() == "Item A,160000.0,4.5,3,M,Male,2025-05-10T10:00:00.000000\n"
+        mock_connection.commit.assert_called_once()
+        mock_connection.close.assert_called_once()
+        # The caller's frame keeps its original column names
+        assert list(sample_dataframe.columns)[0] == "Title"
+    
+    @patch("sqlalchemy.create_engine")
+    def test_engine_created_once_with_batching(self, mock_create_engine, sample_dataframe):
+        """Test that the engine is built once per URL and shared between loaders."""
+        with patch("pandas.DataFrame.to_sql"):
+            for _ in range(2):
+                PostgreSQLDataLoader().load(
+                    sample_dataframe, db_name="db", user="u", password="p", use_copy=False
+                )
+        
+        mock_create_engine.assert_called_once_with(
+            "postgresql+psycopg2://u:p@localhost:5432/db",
+            insertmanyvalues_page_size=10000,
+            pool_pre_ping=True,
+            pool_size=4,
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=1000
+        )
+    
+    def test_load_non_postgres_url_uses_to_sql(self, sample_dataframe):
+        """Test that COPY is skipped for other databases given by URL."""
+        from sqlalchemy import create_engine as real_create_engine
+        engine = real_create_engine("sqlite://")
+        loader = PostgreSQLDataLoader()
+        
+        with patch("sqlalchemy.create_engine", return_value=engine):
+            result = loader.load(sample_dataframe, url="sqlite://")
+        
+        assert result is True
+        stored = pd.read_sql("SELECT title, colors FROM fashion_products", engine)
+        assert stored.to_dict("list") == {"title": ["Item A"], "colors": [3]}
     
-    @patch("utils.load.create_engine", side_effect=Exception("Connection failed"))
+    @patch("sqlalchemy.create_engine", side_effect=Exception("Connection failed"))
     def test_load_exception(self, mock_create_engine, sample_dataframe, capsys):
         """Test PostgreSQL loading exception handling."""
         loader = PostgreSQLDataLoader()
@@ -108,8 +339,8 @@ class TestPostgreSQLDataLoader:
 class TestGoogleSheetsDataLoader:
     """Tests for GoogleSheetsDataLoader class."""
     
-    @patch("utils.load.Credentials.from_service_account_file")
-    @patch("utils.load.build")
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    @patch("googleapiclient.discovery.build")
     def test_load_success(self, mock_build, mock_creds, sample_dataframe):
         """Test successful Google Sheets loading."""
         mock_service = MagicMock()
@@ -118,8 +349,8 @@ class TestGoogleSheetsDataLoader:
 
         mock_service.spreadsheets.return_value = mock_spreadsheets
         mock_spreadsheets.values.return_value = mock_values
-        mock_values.clear.return_value.execute.return_value = None
-        mock_values.update.return_value.execute.return_value = None
+        mock_values.batchClear.return_value.execute.return_value = None
+        mock_values.batchUpdate.return_value.execute.return_value = None
         mock_build.return_value = mock_service
         
         loader = GoogleSheetsDataLoader()
@@ -132,11 +363,124 @@ class TestGoogleSheetsDataLoader:
         
         assert result is True
         mock_creds.assert_called_once()
-        mock_build.assert_called_once_with("sheets", "v4", credentials=mock_creds.return_value)
-        assert mock_values.clear.called
-        assert mock_values.update.called
+        mock_build.assert_called_once()
+        assert mock_build.call_args.kwargs["credentials"] is mock_creds.return_value
+        assert isinstance(mock_build.call_args.kwargs["model"], OrjsonModel)
+        assert mock_build.call_args.kwargs["static_discovery"] is True
+        assert mock_build.call_args.kwargs["cache_discovery"] is False
+        assert mock_values.batchClear.called
+        assert mock_values.batchUpdate.called
+    
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    @patch("googleapiclient.discovery.build")
+    def test_load_without_clear(self, mock_build, mock_creds, sample_dataframe):
+        """Test that clear=False writes the data in a single request."""
+        mock_values = mock_build.return_value.spreadsheets.return_value.values.return_value
+        
+        loader = GoogleSheetsDataLoader()
+        result = loader.load(
+            sample_dataframe,
+            spreadsheet_id="fake_id",
+            range_name="Sheet1!A1",
+            credential_file="fake_credential.json",
+            clear=False
+        )
+        
+        assert result is True
+        mock_values.batchClear.assert_not_called()
+        mock_values.batchUpdate.assert_called_once()
+        body = mock_values.batchUpdate.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "RAW"
+        assert body["data"][0]["range"] == "Sheet1!A1"
+        assert body["data"][0]["values"][0] == list(sample_dataframe.columns)
+    
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    @patch("googleapiclient.discovery.build")
+    def test_load_reuses_service(self, mock_build, mock_creds, sample_dataframe):
+        """Test that credentials are parsed once per key file across loads."""
+        loader = GoogleSheetsDataLoader()
+        for _ in range(2):
+            loader.load(
+                sample_dataframe,
+                spreadsheet_id="fake_id",
+                range_name="Sheet1!A1",
+                credential_file="fake_credential.json"
+            )
+        
+        mock_creds.assert_called_once()
+        mock_build.assert_called_once()
+    
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    @patch("googleapiclient.discovery.build")
+    def test_load_values_are_native_rows(self, mock_build, mock_creds, sample_dataframe):
+        """Test that rows are sent as native Python values in column order."""
+        mock_values = mock_build.return_value.spreadsheets.return_value.values.return_value
+        
+        loader = GoogleSheetsDataLoader()
+        loader.load(
+            sample_dataframe,
+            spreadsheet_id="fake_id",
+            range_name="Sheet1!A1",
+            credential_file="fake_credential.json",
+            clear=False
+        )
+        
+        values = mock_values.batchUpdate.call_args.kwargs["body"]["data"][0]["values"]
+        assert values[1:] == sample_dataframe.values.tolist()
+        assert all(type(cell).__module__ == "builtins" for row in values for cell in row)
+    
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    @patch("googleapiclient.discovery.build")
+    def test_load_formats_timestamps(self, mock_build, mock_creds, sample_dataframe):
+        """Test that datetime columns are sent as ISO strings."""
+        mock_values = mock_build.return_value.spreadsheets.return_value.values.return_value
+        data = sample_dataframe.assign(Timestamp=pd.to_datetime(sample_dataframe["Timestamp"]))
+        
+        GoogleSheetsDataLoader().load(
+            data,
+            spreadsheet_id="fake_id",
+            range_name="Sheet1!A1",
+            credential_file="fake_credential.json",
+            clear=False
+        )
+        
+        values = mock_values.batchUpdate.call_args.kwargs["body"]["data"][0]["values"]
+        assert values[1][-1] == "2025-05-10T10:00:00.000000"
     
-    @patch("utils.load.Credentials.from_service_account_file", side_effect=Exception("Invalid credentials"))
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    @patch("googleapiclient.discovery.build")
+    def test_load_multiple_ranges(self, mock_build, mock_creds, sample_dataframe):
+        """Test that extra ranges share the clear and update requests."""
+        mock_values = mock_build.return_value.spreadsheets.return_value.values.return_value
+        summary = pd.DataFrame({"Rows": [1]})
+        
+        result = GoogleSheetsDataLoader().load(
+            sample_dataframe,
+            spreadsheet_id="fake_id",
+            range_name="Sheet1!A1",
+            credential_file="fake_credential.json",
+            ranges={"Summary!A1": summary}
+        )
+        
+        assert result is True
+        mock_values.batchClear.assert_called_once_with(
+            spreadsheetId="fake_id", body={"ranges": ["Sheet1!A1", "Summary!A1"]}
+        )
+        mock_values.batchUpdate.assert_called_once()
+        data = mock_values.batchUpdate.call_args.kwargs["body"]["data"]
+        assert [entry["range"] for entry in data] == ["Sheet1!A1", "Summary!A1"]
+        assert data[1]["values"] == [["Rows"], [1]]
+    
+    def test_orjson_model_serializes_body(self):
+        """Test that request bodies serialize to JSON bytes, numpy scalars included."""
+        body = {"values": [["Rating", "Price"], [np.float64(4.5), np.int64(3)]]}
+        
+        serialized = OrjsonModel(data_wrapper=False).serialize(body)
+        
+        assert isinstance(serialized, bytes)
+        assert json.loads(serialized) == {"values": [["Rating", "Price"], [4.5, 3]]}
+    
+    @patch("google.oauth2.service_account.Credentials.from_service_account_file", side_effect=Exception("Invalid credentials"))
     def test_load_exception(self, mock_creds, sample_dataframe, capsys):
         """Test Google Sheets loading exception handling."""
         loader = GoogleSheetsDataLoader()
@@ -152,6 +496,46 @@ class TestGoogleSheetsDataLoader:
         assert "[Google Sheets Error]" in captured.out
 
 
+class TestDatabaseConfig:
+    """Tests for the cached environment-based database configuration."""
+    
+    def test_config_read_once_and_read_only(self, monkeypatch):
+        """Test that the environment is read once and the result cannot be mutated."""
+        get_database_config.cache_clear()
+        monkeypatch.setenv("POSTGRES_HOST", "db.internal")
+        try:
+            config = get_database_config()
+            monkeypatch.setenv("POSTGRES_HOST", "elsewhere")
+            
+            assert get_database_config() is config
+            assert config["host"] == "db.internal"
+            with pytest.raises(TypeError):
+                config["host"] = "other"
+        finally:
+            get_database_config.cache_clear()
+
+
+class TestLazyImports:
+    """Tests that destination SDKs are only imported when used."""
+    
+    def test_csv_load_without_destination_sdks(self, tmp_path):
+        """Test that the load module imports and writes CSV with the database and Google SDKs blocked."""
+        blocked = ('sqlalchemy', 'psycopg2', 'googleapiclient', 'google', 'orjson', 'dotenv')
+        code = (
+            "import sys\n"
+            f"sys.modules.update(dict.fromkeys({blocked!r}))\n"
+            "import pandas as pd\n"
+            "from utils.load import CsvDataLoader\n"
+            f"print(CsvDataLoader().load(pd.DataFrame({{'A': [1]}}), filename={str(tmp_path / 'out.csv')!r}))\n"
+        )
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+        
+        assert output.strip().endswith("True")
+
+
 class TestMultiDestinationDataLoader:
     """Tests for MultiDestinationDataLoader class."""
     
@@ -175,6 +559,20 @@ class TestMultiDestinationDataLoader:
         mock_postgres.assert_called_once()
         mock_gsheet.assert_called_once()
     
+    @patch("utils.load.CsvDataLoader.load", return_value=True)
+    @patch("utils.load.PostgreSQLDataLoader.load", return_value=True)
+    @patch("utils.load.GoogleSheetsDataLoader.load", return_value=True)
+    @patch("utils.load.ParquetDataLoader.load", return_value=True)
+    def test_load_to_all_with_parquet(self, mock_parquet, mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
+        """Test that a Parquet destination is added only when a filename is given."""
+        loader = MultiDestinationDataLoader()
+        
+        assert 'parquet' not in loader.load_to_all(sample_dataframe)
+        results = loader.load_to_all(sample_dataframe, filename_parquet="out.parquet")
+        
+        assert results['parquet'] is True
+        mock_parquet.assert_called_once_with(sample_dataframe, filename="out.parquet")
+    
     @patch("utils.load.CsvDataLoader.load")
     @patch("utils.load.PostgreSQLDataLoader.load")
     @patch("utils.load.GoogleSheetsDataLoader.load")
@@ -190,6 +588,68 @@ class TestMultiDestinationDataLoader:
         assert results['csv'] is True
         assert results['postgresql'] is False
         assert results['google_sheets'] is True
+    
+    @patch("utils.load.GoogleSheetsDataLoader.load", return_value=True)
+    def test_load_batches_appends_concurrently(self, mock_gsheet, sample_dataframe):
+        """Test that the CSV and PostgreSQL appends of a batch overlap."""
+        # Each load waits for the other; run one after the other, they would time out
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def wait_for_other(*args, **kwargs):
+            barrier.wait()
+            return True
+        
+        with patch("utils.load.CsvDataLoader.load", side_effect=wait_for_other), \
+                patch("utils.load.PostgreSQLDataLoader.load", side_effect=wait_for_other):
+            results = MultiDestinationDataLoader().load_batches(iter([sample_dataframe]))
+        
+        assert results == {'csv': True, 'postgresql': True, 'google_sheets': True}
+
+    @patch("utils.load.CsvDataLoader.load", return_value=True)
+    @patch("utils.load.PostgreSQLDataLoader.load", return_value=True)
+    @patch("utils.load.GoogleSheetsDataLoader.load", return_value=True)
+    def test_load_batches(self, mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
+        """Test incremental loading of batches."""
+        loader = MultiDestinationDataLoader()
+        results = loader.load_batches(iter([sample_dataframe, sample_dataframe]))
+        
+        assert results == {'csv': True, 'postgresql': True, 'google_sheets': True}
+        assert [c.kwargs['mode'] for c in mock_csv.call_args_list] == ['w', 'a']
+        assert [c.kwargs['header'] for c in mock_csv.call_args_list] == [True, False]
+        assert mock_postgres.call_count == 2
+        mock_gsheet.assert_called_once()
+        assert len(mock_gsheet.call_args.args[0]) == 2
+    
+    @patch("utils.load.CsvDataLoader.load", return_value=True)
+    @patch("utils.load.PostgreSQLDataLoader.load", return_value=True)
+    @patch("utils.load.GoogleSheetsDataLoader.load", return_value=True)
+    def test_enabled_destinations_only(self, mock_gsheet, mock_postgres, mock_csv, sample_dataframe):
+        """Test that disabled destinations are not built, not called and reported as None."""
+        loader = MultiDestinationDataLoader(enabled={'csv'})
+        
+        assert loader.sheets_loader is None and loader.postgres_loader is None
+        assert loader.load_to_all(sample_dataframe) == {
+            'csv': True, 'postgresql': None, 'google_sheets': None
+        }
+        assert loader.load_batches(iter([sample_dataframe, sample_dataframe])) == {
+            'csv': True, 'postgresql': None, 'google_sheets': None
+        }
+        assert mock_csv.call_count == 3
+        mock_postgres.assert_not_called()
+        mock_gsheet.assert_not_called()
+    
+    def test_unknown_destination_rejected(self):
+        """Test that a misspelled destination name is an error rather than skipped."""
+        with pytest.raises(ValueError, match="sheets"):
+            MultiDestinationDataLoader(enabled={'csv', 'sheets'})
+    
+    @patch("utils.load.GoogleSheetsDataLoader.load")
+    def test_load_batches_without_batches(self, mock_gsheet):
+        """Test that nothing is loaded when no batch is produced."""
+        loader = MultiDestinationDataLoader()
+        
+        assert loader.load_batches(iter([])) == {}
+        mock_gsheet.assert_not_called()
 
 
 class TestLegacyFunctions:
@@ -12,6 +12,9 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from main import ETLPipeline, main
+from utils.models import Product
+from utils.config import PRODUCT_COLUMNS
+from datetime import datetime
 import pandas as pd
 
 
@@ -25,9 +28,9 @@ class TestETLPipeline(unittest.TestCase):
     def test_extract_data_success(self, mock_extractor_class):
         """Test successful data extraction."""
         mock_extractor = MagicMock()
-        mock_extractor.extract.return_value = [
-            {"Title": "Test Product", "Price": "$10.00", "Rating": "⭐ 4.5"}
-        ]
+        mock_extractor.iter_extract.return_value = iter([
+            Product("Test Product", "$10.00", "⭐ 4.5", "3", "M", "Men", datetime(2025, 5, 10, 10))
+        ])
         mock_extractor_class.return_value = mock_extractor
         
         pipeline = ETLPipeline()
@@ -36,12 +39,13 @@ class TestETLPipeline(unittest.TestCase):
         self.assertFalse(result.empty)
         self.assertEqual(len(result), 1)
         self.assertEqual(result.iloc[0]['Title'], "Test Product")
+        self.assertEqual(list(result.columns), list(PRODUCT_COLUMNS))
     
     @patch('main.FashionDataExtractor')
     def test_extract_data_empty_result(self, mock_extractor_class):
         """Test data extraction with empty result."""
         mock_extractor = MagicMock()
-        mock_extractor.extract.return_value = []
+        mock_extractor.iter_extract.return_value = iter([])
         mock_extractor_class.return_value = mock_extractor
         
         pipeline = ETLPipeline()
@@ -74,6 +78,19 @@ class TestETLPipeline(unittest.TestCase):
         self.assertEqual(result.iloc[0]['Price'], 160000.0)
         self.assertEqual(result.iloc[0]['Rating'], 4.5)
     
+    @patch('main.FashionDataTransformer')
+    def test_transform_data_diagnostics_only_when_verbose(self, mock_transformer_class):
+        """Test that DataFrame diagnostics are skipped unless verbose is set."""
+        mock_transformer_class.return_value.transform.return_value = pd.DataFrame({"Title": ["Test Product"]})
+        input_df = pd.DataFrame({"Title": ["Test Product"]})
+        
+        with patch.object(pd.DataFrame, 'info') as mock_info:
+            ETLPipeline().transform_data(input_df)
+            mock_info.assert_not_called()
+            
+            ETLPipeline(verbose=True).transform_data(input_df)
+            self.assertEqual(mock_info.call_count, 2)
+    
     def test_transform_data_empty_input(self):
         """Test data transformation with empty input."""
         pipeline = ETLPipeline()
@@ -105,6 +122,25 @@ class TestETLPipeline(unittest.TestCase):
         
         mock_loader.load_to_all.assert_called_once_with(test_df)
     
+    @patch('main.MultiDestinationDataLoader')
+    def test_load_data_reports_results(self, mock_loader_class):
+        """Test the load summary, leaving disabled destinations out of the count."""
+        mock_loader_class.return_value.load_to_all.return_value = {
+            'csv': True,
+            'postgresql': False,
+            'google_sheets': None
+        }
+        
+        with patch('builtins.print') as mock_print:
+            ETLPipeline().load_data(pd.DataFrame({"Title": ["Test Product"]}))
+        
+        mock_print.assert_called_with(
+            "Loading completed. 1/2 destinations successful.\n"
+            "  ✓ csv\n"
+            "  ✗ postgresql\n"
+            "  - google_sheets (disabled)"
+        )
+    
     def test_load_data_empty_input(self):
         """Test data loading with empty input."""
         pipeline = ETLPipeline()
@@ -146,6 +182,23 @@ class TestETLPipeline(unittest.TestCase):
         mock_extract.assert_called_once()
 
 
+    @patch('main.MultiDestinationDataLoader')
+    @patch('main.FashionDataExtractor')
+    def test_run_streaming_transforms_each_page(self, mock_extractor_class, mock_loader_class):
+        """Test that streaming mode cleans pages one at a time and hands them to the loader."""
+        page = [Product("Test Product", "$10.00", "⭐ 4.5", "3 Colors", "M", "Men", datetime(2025, 5, 10, 10))]
+        mock_extractor_class.return_value.iter_pages.return_value = iter([page, page])
+        mock_loader = mock_loader_class.return_value
+        batches = []
+        mock_loader.load_batches.side_effect = lambda stream: batches.extend(stream) or {'csv': True}
+        
+        ETLPipeline().run_streaming(total_pages=2)
+        
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batches[0].iloc[0]['Price'], 160000.0)
+        mock_extractor_class.return_value.iter_pages.assert_called_once_with(total_pages=2)
+
+
 class TestMainFunction(unittest.TestCase):
     """Tests for main function."""
     
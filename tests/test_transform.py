@@ -4,8 +4,11 @@ Tests the new class-based architecture with individual cleaners.
 """
 
 import pytest
+from datetime import datetime
+import numpy as np
 import pandas as pd
 import sys
+from unittest.mock import patch
 import os
 
 # Add parent directory to path
@@ -17,6 +20,7 @@ from utils.transform import (
     ColorsCleaner,
     AttributeCleaner,
     TimestampCleaner,
+    DtypeOptimizer,
     FashionDataTransformer,
     clean_and_transform
 )
@@ -49,6 +53,31 @@ class TestRatingCleaner:
         
         assert len(result) == 1
         assert result["Rating"].iloc[0] == 4.5
+    
+    def test_clean_whole_number_rating(self):
+        """Test that ratings without a decimal part are kept."""
+        df = pd.DataFrame({"Rating": ["⭐ 5"], "Other": ["A"]})
+        result = RatingCleaner.clean(df)
+        
+        assert result["Rating"].iloc[0] == 5.0
+    
+    def test_clean_rating_without_star(self):
+        """Test that bare numeric ratings are accepted alongside star ratings."""
+        df = pd.DataFrame({"Rating": ["4.2", "⭐ 3.9", "Invalid Rating"], "Other": ["A", "B", "C"]})
+        result = RatingCleaner.clean(df)
+        
+        assert result["Rating"].tolist() == [4.2, 3.9]
+    
+    def test_convert_without_pyarrow(self):
+        """Test that the pandas regex fallback parses the same ratings."""
+        ratings = pd.Series(["4.2", "⭐ 3.9", "Invalid Rating", None])
+        expected = RatingCleaner.convert(ratings)
+        
+        with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.compute": None}):
+            result = RatingCleaner.convert(ratings)
+        
+        pd.testing.assert_series_equal(result, expected)
+        assert result.isna().tolist() == [False, False, True, True]
 
 
 class TestPriceCleaner:
@@ -79,6 +108,40 @@ class TestPriceCleaner:
         result = cleaner.clean(df)
         
         assert result["Price"].iloc[0] == 150000.0
+    
+    def test_clean_thousands_separator(self):
+        """Test that comma-grouped prices parse and unparsable ones are dropped."""
+        df = pd.DataFrame({"Price": ["$1,250.50", "Price Not Available"], "Other": ["A", "B"]})
+        result = PriceCleaner(usd_to_idr_rate=2).clean(df)
+        
+        assert result["Other"].tolist() == ["A"]
+        assert result["Price"].iloc[0] == 2501.0
+    
+    def test_convert_without_pyarrow(self):
+        """Test that the pandas fallback parses the same prices."""
+        prices = pd.Series(["$1,250.50", "$3", "Price Not Available", None])
+        cleaner = PriceCleaner(usd_to_idr_rate=2)
+        expected = cleaner.convert(prices)
+        
+        with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.compute": None}):
+            result = cleaner.convert(prices)
+        
+        pd.testing.assert_series_equal(result, expected)
+        assert result.tolist()[:2] == [2501.0, 6.0]
+    
+    @pytest.mark.parametrize("with_pyarrow", [True, False])
+    def test_convert_rejects_signed_exponent_and_padded(self, with_pyarrow):
+        """Test that only plain amounts parse, whether or not pyarrow is installed."""
+        if with_pyarrow:
+            pytest.importorskip("pyarrow")
+        prices = pd.Series(["$102.15", "$-3", "$1e3", "$ 5", "$1,234.50", "Price Unavailable"])
+        blocked = {} if with_pyarrow else {"pyarrow": None, "pyarrow.compute": None}
+        
+        with patch.dict(sys.modules, blocked):
+            result = PriceCleaner(usd_to_idr_rate=16000).convert(prices)
+        
+        assert result.isna().tolist() == [False, True, True, True, False, True]
+        assert result[[0, 4]].tolist() == [1634400.0, 19752000.0]
 
 
 class TestColorsCleaner:
@@ -94,7 +157,7 @@ class TestColorsCleaner:
         result = ColorsCleaner.clean(df)
         
         assert not result.empty
-        assert result["Colors"].dtype == int
+        assert result["Colors"].dtype == "int32"
         assert result["Colors"].iloc[0] == 3
         assert result["Colors"].iloc[1] == 5
 
@@ -115,6 +178,24 @@ class TestAttributeCleaner:
         assert not result.empty
         assert pd.api.types.is_string_dtype(result["Size"])
         assert pd.api.types.is_string_dtype(result["Gender"])
+        assert isinstance(result["Size"].dtype, pd.CategoricalDtype)
+        assert isinstance(result["Gender"].dtype, pd.CategoricalDtype)
+        assert result["Gender"].tolist() == ["Male", "Female"]
+    
+    def test_convert_stringifies_labels(self):
+        """Test that non-string labels become string categories."""
+        result = AttributeCleaner.convert(pd.Series([1, 2, 1]))
+        
+        assert list(result.cat.categories) == ["1", "2"]
+        assert result.tolist() == ["1", "2", "1"]
+    
+    def test_convert_merges_labels_equal_as_strings(self):
+        """Test that labels like 1 and "1" merge into one string category."""
+        result = AttributeCleaner.convert(pd.Series([1, "1", "M", None]))
+        
+        assert sorted(result.cat.categories) == ["1", "M"]
+        assert result.tolist()[:3] == ["1", "1", "M"]
+        assert pd.isna(result.iloc[3])
 
 
 class TestTimestampCleaner:
@@ -130,7 +211,44 @@ class TestTimestampCleaner:
         result = TimestampCleaner.clean(df)
         
         assert not result.empty
-        assert result["Timestamp"].str.contains("T").all()
+        assert pd.api.types.is_datetime64_any_dtype(result["Timestamp"])
+        assert result["Timestamp"].iloc[1] == pd.Timestamp("2025-05-10 11:00:00")
+    
+    def test_clean_timestamp_objects_and_fractions(self):
+        """Test that datetime values and fractional-second strings keep their precision."""
+        df = pd.DataFrame({
+            "Timestamp": [datetime(2025, 5, 10, 10, 0, 0, 123456), "2025-05-10 11:00:00.5"]
+        })
+        result = TimestampCleaner.clean(df)
+        
+        assert result["Timestamp"].tolist() == [
+            pd.Timestamp("2025-05-10T10:00:00.123456"),
+            pd.Timestamp("2025-05-10T11:00:00.500000")
+        ]
+
+
+class TestDtypeOptimizer:
+    """Tests for DtypeOptimizer class."""
+    
+    def test_optimize_dtypes(self):
+        """Test that color counts are downcast and other columns are left alone."""
+        data = {
+            "Colors": [3, 5],
+            "Price": [160000.0, 320000.0]
+        }
+        df = pd.DataFrame(data)
+        result = DtypeOptimizer.optimize(df)
+        
+        assert result["Colors"].dtype == "uint8"
+        assert result["Price"].dtype == float
+        assert result["Colors"].tolist() == [3, 5]
+    
+    def test_optimize_skips_missing_columns(self):
+        """Test that frames without optimizable columns are left untouched."""
+        df = pd.DataFrame({"Title": ["Item A"]})
+        result = DtypeOptimizer.optimize(df)
+        
+        assert list(result.columns) == ["Title"]
 
 
 class TestFashionDataTransformer:
@@ -154,10 +272,10 @@ class TestFashionDataTransformer:
         assert not result.empty
         assert result["Rating"].dtype == float
         assert result["Price"].dtype == float
-        assert result["Colors"].dtype == int
+        assert np.issubdtype(result["Colors"].dtype, np.integer)
         assert pd.api.types.is_string_dtype(result["Size"])
         assert pd.api.types.is_string_dtype(result["Gender"])
-        assert result["Timestamp"].str.contains("T").all()
+        assert pd.api.types.is_datetime64_any_dtype(result["Timestamp"])
     
     def test_transform_invalid_rating(self):
         """Test transformation with invalid rating data."""
@@ -196,6 +314,151 @@ class TestFashionDataTransformer:
         assert result.empty
 
 
+    def test_transform_drops_only_unparsable_rows(self):
+        """Test that rows with a missing price or color count are dropped individually."""
+        data = {
+            "Title": ["Item A", "Item B", "Item C"],
+            "Price": ["$10.00", "Price Not Available", "$30.00"],
+            "Rating": ["⭐ 4.5", "⭐ 3.9", "⭐ 4.1"],
+            "Colors": ["3 Colors", "5 Colors", "No Colors"],
+            "Size": ["M", "L", "S"],
+            "Gender": ["Male", "Female", "Unisex"],
+            "Timestamp": ["2025-05-10 10:00:00"] * 3
+        }
+        df = pd.DataFrame(data)
+        transformer = FashionDataTransformer()
+        result = transformer.transform(df)
+        
+        assert result["Title"].tolist() == ["Item A"]
+        assert result["Price"].iloc[0] == 160000.0
+
+
+class TestFusedTransform:
+    """Tests for the single-pass pandas transformation."""
+    
+    def test_transform_leaves_input_untouched(self):
+        """Test that cleaning returns a new frame in the original column order."""
+        data = {
+            "Title": ["Item A", "Item B"],
+            "Price": ["$10.00", "$20.00"],
+            "Rating": ["⭐ 4.5", "⭐ 3.9"],
+            "Colors": ["3 Colors", "5 Colors"],
+            "Size": ["M", "L"],
+            "Gender": ["Male", "Female"],
+            "Timestamp": ["2025-05-10 10:00:00", "2025-05-10 11:00:00"]
+        }
+        df = pd.DataFrame(data)
+        result = FashionDataTransformer().transform(df)
+        
+        assert list(result.columns) == list(data)
+        assert df.to_dict("list") == data
+        assert result["Colors"].tolist() == [3, 5]
+        
+        # Writing to the result in place must not reach the raw input
+        result["Title"].to_numpy()[0] = "MUTATED"
+        assert df["Title"].tolist() == ["Item A", "Item B"]
+    
+    def test_transform_output_independent_of_datetime_input(self):
+        """Test that an already parsed Timestamp column is not shared with the input."""
+        df = pd.DataFrame({
+            "Title": ["Item A"],
+            "Price": ["$10.00"],
+            "Rating": ["⭐ 4.5"],
+            "Colors": ["3 Colors"],
+            "Size": ["M"],
+            "Gender": ["Male"],
+            "Timestamp": pd.to_datetime(["2025-05-10 10:00:00"])
+        })
+        result = FashionDataTransformer().transform(df)
+        
+        result["Timestamp"].to_numpy()[0] = np.datetime64("2000-01-01")
+        assert df["Timestamp"].iloc[0] == pd.Timestamp("2025-05-10 10:00:00")
+    
+    def test_transform_arrow_string_columns(self):
+        """Test that Arrow-backed string columns clean like object columns."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({
+            "Title": ["Item A", "Item B"],
+            "Price": ["$10.00", "Price Not Available"],
+            "Rating": ["⭐ 4.5", "⭐ 3.9"],
+            "Colors": ["3 Colors", "5 Colors"],
+            "Size": ["M", "L"],
+            "Gender": ["Male", "Female"],
+            "Timestamp": ["2025-05-10 10:00:00", "2025-05-10 11:00:00"]
+        })
+        arrow_df = df.astype({c: "string[pyarrow]" for c in ("Price", "Rating", "Colors")})
+        arrow_df = arrow_df.astype({"Size": "category", "Gender": "category"})
+        
+        expected = FashionDataTransformer().transform(df)
+        result = FashionDataTransformer().transform(arrow_df)
+        
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestPolarsBackend:
+    """Tests for the optional Polars transformation backend."""
+    
+    def test_polars_matches_pandas(self):
+        """Test that the Polars backend yields the same data and dtypes as pandas."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        data = {
+            "Title": ["Item A", "Item B", "Item C"],
+            "Price": ["$10.00", "Price Not Available", "$1,030.05"],
+            "Rating": ["⭐ 4.5", "⭐ 3.9", "Invalid Rating"],
+            "Colors": ["3 Colors", "5 Colors", "7 Colors"],
+            "Size": ["M", "L", "S"],
+            "Gender": ["Male", "Female", "Unisex"],
+            "Timestamp": [datetime(2025, 5, 10, 10, 0, 0, 123456)] * 3
+        }
+        df = pd.DataFrame(data)
+        
+        expected = FashionDataTransformer(backend="pandas").transform(df).reset_index(drop=True)
+        result = FashionDataTransformer(backend="polars").transform(df)
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_missing_attributes_stay_missing(self):
+        """Test that missing Size and Gender values stay missing on both backends."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({
+            "Title": ["A", "B"],
+            "Price": ["$10.00", "$20.00"],
+            "Rating": ["⭐ 4.5", "⭐ 3.9"],
+            "Colors": ["3 Colors", "5 Colors"],
+            "Size": ["M", None],
+            "Gender": [np.nan, "Men"],
+            "Timestamp": ["2025-05-10 10:00:00"] * 2
+        })
+        
+        for backend in ("pandas", "polars"):
+            result = FashionDataTransformer(backend=backend).transform(df)
+            
+            assert result["Size"].isna().tolist() == [False, True]
+            assert result["Gender"].isna().tolist() == [True, False]
+            assert "None" not in result["Size"].cat.categories
+            assert "nan" not in result["Gender"].cat.categories
+    
+    def test_polars_rejects_signed_and_exponent_prices(self):
+        """Test that the Polars backend drops the prices the pandas cleaners reject."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({
+            "Title": ["A", "B", "C", "D"],
+            "Price": ["$10.00", "$-3", "$1e3", "$ 5"],
+            "Rating": ["⭐ 4.5"] * 4,
+            "Colors": ["3 Colors"] * 4,
+            "Size": ["M"] * 4,
+            "Gender": ["Male"] * 4,
+            "Timestamp": ["2025-05-10 10:00:00"] * 4
+        })
+        
+        result = FashionDataTransformer(backend="polars").transform(df)
+        
+        assert result["Title"].tolist() == ["A"]
+
+
 class TestLegacyFunction:
     """Tests for legacy function wrapper."""
     
@@ -3,8 +3,11 @@ Configuration module for the ETL pipeline.
 Contains all constants and configuration settings.
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
 import os
+import re
 
 # HTTP Configuration
 HEADERS: Dict[str, str] = {
@@ -14,17 +17,62 @@ HEADERS: Dict[str, str] = {
     )
 }
 
+HTTP_CONFIG: Dict[str, Any] = {
+    "timeout": 10,
+    "pool_connections": 20,
+    "pool_maxsize": 20,
+    "retries": 3,
+    "backoff_factor": 0.5,
+    "status_forcelist": (429, 500, 502, 503, 504)
+}
+
+# Logging Configuration, applied once at application start
+LOGGING_CONFIG: Dict[str, Any] = {
+    "level": "INFO",
+    "format": "%(message)s"
+}
+
 # URL Configuration
 BASE_URL: str = "https://fashion-studio.dicoding.dev/"
 
+# Performance Configuration
+PERFORMANCE_CONFIG: Dict[str, Any] = {
+    "max_workers": 10,
+    "parse_processes": None
+}
+
 # Data Extraction Patterns
 EXTRACTION_PATTERNS: Dict[str, str] = {
-    "rating": r"Rating:\s*(⭐\s*\d+(?:\.\d+)?)",
+    "rating": r"Rating:\s*(⭐\s*\d+(?:\.\d+)?|\d+(?:\.\d+)?)",
     "colors": r"(\d+)\s*Colors",
     "size": r"Size:\s*(\w+)",
     "gender": r"Gender:\s*(\w+)"
 }
 
+# Patterns compiled once at import and shared by the extract and transform steps
+COMPILED_EXTRACTION_PATTERNS: Dict[str, re.Pattern] = {
+    name: re.compile(pattern) for name, pattern in EXTRACTION_PATTERNS.items()
+}
+RATING_VALUE_PATTERN: re.Pattern = re.compile(r"^(?:⭐\s*)?(?P<value>\d+(?:\.\d+)?)")
+COLORS_COUNT_PATTERN: re.Pattern = re.compile(r"(?P<value>\d+)")
+PRICE_AMOUNT_PATTERN: re.Pattern = re.compile(r"^\$?(?P<value>\d+(?:\.\d+)?)$")
+
+# Keyword that marks the paragraph each extraction pattern applies to
+EXTRACTION_KEYWORDS: Dict[str, str] = {
+    "rating": "Rating",
+    "colors": "Colors",
+    "size": "Size",
+    "gender": "Gender"
+}
+
+# Column order of extracted product records
+PRODUCT_COLUMNS: Tuple[str, ...] = (
+    "Title", "Price", "Rating", "Colors", "Size", "Gender", "Timestamp"
+)
+
+# Text form of timestamps at sinks that store strings (CSV, Google Sheets)
+TIMESTAMP_FORMAT: str = "%Y-%m-%dT%H:%M:%S.%f"
+
 # Default Values
 DEFAULT_VALUES: Dict[str, str] = {
     "title": "Unknown Title",
@@ -35,9 +83,18 @@ DEFAULT_VALUES: Dict[str, str] = {
     "gender": "Unknown"
 }
 
+# Defaults read for every card, bound to names to skip the dict lookups
+DEFAULT_TITLE: str = DEFAULT_VALUES["title"]
+DEFAULT_PRICE: str = DEFAULT_VALUES["price"]
+
 # File Configuration
-FILE_CONFIG: Dict[str, str] = {
+FILE_CONFIG: Dict[str, Any] = {
     "default_csv_filename": "fashion_data.csv",
+    "csv_chunksize": 10000,
+    "csv_engine": "pandas",
+    "csv_buffer_size": 1 << 20,
+    "default_parquet_filename": "fashion_data.parquet",
+    "parquet_compression": "zstd",
     "google_credentials_file": "google-sheets-api.json",
     "legacy_credentials_file": "client_secret.json"
 }
@@ -49,20 +106,34 @@ DATABASE_CONFIG: Dict[str, Any] = {
     "default_table": "fashion_products",
     "default_db_name": "fashion_db",
     "default_user": "postgres",
-    "default_password": "postgres"
+    "default_password": "postgres",
+    "pool_size": 4,
+    "insertmanyvalues_page_size": 10000,
+    "executemany_batch_page_size": 1000,
+    "to_sql_chunksize": 1000
 }
 
 # Environment-based Database Configuration
-def get_database_config() -> Dict[str, Any]:
-    """Get database configuration from environment variables with fallbacks."""
-    return {
+@lru_cache(maxsize=1)
+def get_database_config() -> Mapping[str, Any]:
+    """Get database configuration from environment variables with fallbacks.
+    
+    The environment is read on the first call only and the result is
+    read-only; call ``get_database_config.cache_clear()`` to re-read it.
+    A ``.env`` file is loaded into the environment first unless
+    ``LOAD_DOTENV=0`` is set.
+    """
+    if os.environ.get("LOAD_DOTENV", "1") == "1":
+        from dotenv import load_dotenv
+        load_dotenv()
+    return MappingProxyType({
         "db_name": os.getenv("POSTGRES_DB", DATABASE_CONFIG["default_db_name"]),
         "user": os.getenv("POSTGRES_USER", DATABASE_CONFIG["default_user"]),
         "password": os.getenv("POSTGRES_PASSWORD", DATABASE_CONFIG["default_password"]),
         "host": os.getenv("POSTGRES_HOST", DATABASE_CONFIG["default_host"]),
         "port": int(os.getenv("POSTGRES_PORT", str(DATABASE_CONFIG["default_port"]))),
         "table_name": DATABASE_CONFIG["default_table"]
-    }
+    })
 
 # Google Sheets Configuration
 GOOGLE_SHEETS_CONFIG: Dict[str, Any] = {
@@ -75,5 +146,6 @@ GOOGLE_SHEETS_CONFIG: Dict[str, Any] = {
 # Transformation Configuration
 TRANSFORMATION_CONFIG: Dict[str, Any] = {
     "usd_to_idr_rate": 16000,
-    "price_decimal_places": 1
+    "price_decimal_places": 1,
+    "backend": "pandas"
 }
\ No newline at end of file
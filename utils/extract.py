@@ -3,12 +3,20 @@ Data extraction module implementing SOLID principles.
 Contains concrete implementations for web scraping and data extraction.
 """
 
+import logging
+import threading
 import time
+from collections import deque
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
 import re
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .interfaces import (
     DataExtractorInterface,
@@ -16,89 +24,222 @@ from .interfaces import (
     ProductParserInterface,
     TextExtractorInterface
 )
-from .config import HEADERS, BASE_URL, EXTRACTION_PATTERNS, DEFAULT_VALUES
+from .models import Product
+from .config import (
+    HEADERS, HTTP_CONFIG, BASE_URL, COMPILED_EXTRACTION_PATTERNS, EXTRACTION_KEYWORDS,
+    DEFAULT_VALUES, DEFAULT_TITLE, DEFAULT_PRICE, PERFORMANCE_CONFIG
+)
+
+logger = logging.getLogger(__name__)
+
+# Restricts page parsing to product cards so the rest of the page never becomes a tree
+CARD_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)collection-card(?:\s|$)'))
 
 
 class HttpContentFetcher(ContentFetcherInterface):
     """Concrete implementation for fetching HTTP content."""
     
+    __slots__ = ("headers", "session")
+    
     def __init__(self, headers: Dict[str, str] = None):
         self.headers = headers or HEADERS
+        # A shared session keeps connections alive across pages and worker threads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Transient failures are retried with backoff by the adapter itself
+        retry = Retry(
+            total=HTTP_CONFIG["retries"],
+            backoff_factor=HTTP_CONFIG["backoff_factor"],
+            status_forcelist=HTTP_CONFIG["status_forcelist"],
+            allowed_methods=frozenset({"GET"})
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_CONFIG["pool_connections"],
+            pool_maxsize=HTTP_CONFIG["pool_maxsize"],
+            max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def fetch(self, url: str) -> Optional[bytes]:
-        """Fetch content from URL with error handling."""
+        """Fetch content from URL with error handling.
+        
+        The body is streamed and read into a single bytes object, instead of
+        being buffered as chunks and joined into a second copy.
+        """
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.content
-        except requests.RequestException as e:
-            print(f"Error fetching content from {url}: {e}")
+            with self.session.get(url, stream=True, timeout=HTTP_CONFIG["timeout"]) as response:
+                response.raise_for_status()
+                return response.raw.read(decode_content=True)
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            logger.warning("Error fetching content from %s: %s", url, e)
             return None
 
 
 class RegexTextExtractor(TextExtractorInterface):
     """Concrete implementation for regex-based text extraction."""
     
-    def extract_text(self, elements: List, keyword: str, pattern: str, default: str = "N/A") -> str:
+    __slots__ = ("_compiled",)
+    
+    def __init__(self):
+        # Keyed by source string, so string patterns reuse the shared compiled ones
+        self._compiled: Dict[str, re.Pattern] = {
+            compiled.pattern: compiled for compiled in COMPILED_EXTRACTION_PATTERNS.values()
+        }
+    
+    def _compile(self, pattern: Union[str, re.Pattern]) -> re.Pattern:
+        """Return the compiled form of pattern, compiling it only on first use."""
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        compiled = self._compiled.get(pattern)
+        if compiled is None:
+            compiled = self._compiled[pattern] = re.compile(pattern)
+        return compiled
+    
+    def extract_text(self, elements: List, keyword: str, pattern: Union[str, re.Pattern], default: str = "N/A") -> str:
         """Extract text using regex pattern and keyword."""
+        search = self._compile(pattern).search
         for element in elements:
             if element.string and keyword in element.string:
-                match = re.search(pattern, element.string)
+                match = search(element.string)
                 if match:
                     return match.group(1).strip()
         return default
+    
+    def extract_fields(
+        self,
+        elements: List,
+        patterns: Dict[str, Union[str, re.Pattern]],
+        defaults: Dict[str, str],
+        keywords: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Extract all fields with one walk over the elements.
+        
+        Each element's text is matched only against the patterns whose keyword
+        it contains, and the walk stops once every field has been found.
+        Captured groups are stripped, as in extract_text.
+        """
+        keywords = keywords or EXTRACTION_KEYWORDS
+        pending = [
+            (name, keywords[name], self._compile(pattern).search)
+            for name, pattern in patterns.items()
+        ]
+        found: Dict[str, str] = {}
+        for element in elements:
+            text = element.string
+            if not text:
+                continue
+            # One element may carry several fields, so every pending field is tried
+            for field in list(pending):
+                name, keyword, search = field
+                if keyword in text:
+                    match = search(text)
+                    if match:
+                        found[name] = match.group(1).strip()
+                        pending.remove(field)
+            if not pending:
+                break
+        return {name: found.get(name, defaults[name]) for name in patterns}
 
 
 class FashionProductParser(ProductParserInterface):
     """Concrete implementation for parsing fashion product data."""
     
+    __slots__ = ("text_extractor",)
+    
     def __init__(self, text_extractor: TextExtractorInterface):
         self.text_extractor = text_extractor
     
-    def parse(self, html_element) -> Optional[Dict[str, Any]]:
-        """Extract product data from HTML card element."""
-        try:
-            # Extract title
-            title_element = html_element.select_one('.product-details h3.product-title')
-            title = title_element.text.strip() if title_element and title_element.text.strip() else DEFAULT_VALUES["title"]
+    def parse(self, html_element, timestamp: Optional[datetime] = None) -> Optional[Product]:
+        """Extract product data from HTML card element.
+        
+        Cards scraped together can share one timestamp; without one, the
+        current time is used.
+        """
+        # Extract title; plain find() calls skip the CSS selector engine
+        details = html_element.find(class_='product-details')
+        title_element = details.find('h3', class_='product-title') if details else None
+        title = (title_element.get_text().strip() if title_element else "") or DEFAULT_TITLE
 
-            # Extract price
-            price_element = html_element.find('div', class_='price-container')
-            price = price_element.text.strip() if price_element else DEFAULT_VALUES["price"]
+        # Extract price
+        price_element = html_element.find('div', class_='price-container')
+        price = price_element.get_text().strip() if price_element else DEFAULT_PRICE
 
-            # Extract info paragraphs
-            info_paragraphs = html_element.find_all('p')
+        # Extract info paragraphs
+        info_paragraphs = html_element.find_all('p')
 
-            # Extract product attributes using text extractor
-            rating = self.text_extractor.extract_text(
-                info_paragraphs, "Rating", EXTRACTION_PATTERNS["rating"], DEFAULT_VALUES["rating"]
-            )
-            colors = self.text_extractor.extract_text(
-                info_paragraphs, "Colors", EXTRACTION_PATTERNS["colors"], DEFAULT_VALUES["colors"]
-            )
-            size = self.text_extractor.extract_text(
-                info_paragraphs, "Size", EXTRACTION_PATTERNS["size"], DEFAULT_VALUES["size"]
-            )
-            gender = self.text_extractor.extract_text(
-                info_paragraphs, "Gender", EXTRACTION_PATTERNS["gender"], DEFAULT_VALUES["gender"]
-            )
+        # Extract all product attributes in a single pass over the paragraphs
+        attributes = self.text_extractor.extract_fields(
+            info_paragraphs, COMPILED_EXTRACTION_PATTERNS, DEFAULT_VALUES
+        )
 
-            # Add timestamp
+        # Add timestamp
+        if timestamp is None:
             timestamp = datetime.now()
 
-            return {
-                "Title": title,
-                "Price": price,
-                "Rating": rating,
-                "Colors": colors,
-                "Size": size,
-                "Gender": gender,
-                "Timestamp": timestamp
-            }
-
-        except Exception as e:
-            print(f"Error extracting product data: {e}")
-            return None
+        return Product(
+            Title=title,
+            Price=price,
+            Rating=attributes["rating"],
+            Colors=attributes["colors"],
+            Size=attributes["size"],
+            Gender=attributes["gender"],
+            Timestamp=timestamp
+        )
+
+
+def parse_page(product_parser: ProductParserInterface, content: bytes, page_number: int) -> List[Product]:
+    """Parse every product card on a fetched page.
+    
+    Module-level so that it can be sent to worker processes.
+    """
+    products = []
+    
+    # A plain byte search is far cheaper than tokenizing a page that has no cards
+    if b'collection-card' not in content:
+        logger.info("No products found on page %d.", page_number)
+        return products
+    
+    try:
+        soup = BeautifulSoup(content, "lxml", parse_only=CARD_STRAINER)
+        cards = soup.find_all('div', class_='collection-card')
+        
+        if not cards:
+            logger.info("No products found on page %d.", page_number)
+            return products
+        
+        # Every card on a page is stamped with the time the page was parsed
+        timestamp = datetime.now()
+        for card in cards:
+            try:
+                product = product_parser.parse(card, timestamp)
+                if product:
+                    products.append(product)
+            except Exception as e:
+                logger.warning("Error extracting product on page %d: %s", page_number, e)
+        
+    except Exception as e:
+        logger.warning("Error parsing page %d: %s", page_number, e)
+    
+    return products
+
+
+class RateLimiter:
+    """Spaces calls at least `interval` seconds apart across threads."""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def acquire(self) -> None:
+        """Reserve the next free slot and sleep until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class FashionDataExtractor(DataExtractorInterface):
@@ -112,73 +253,152 @@ class FashionDataExtractor(DataExtractorInterface):
         self.content_fetcher = content_fetcher
         self.product_parser = product_parser
     
-    def extract(self, **kwargs) -> List[Dict[str, Any]]:
-        """Scrape fashion products from multiple pages."""
+    @staticmethod
+    def _page_url(page_number: int) -> str:
+        """Build the URL of a listing page."""
+        return BASE_URL if page_number == 1 else f"{BASE_URL}page{page_number}"
+    
+    def _fetch_page(self, url: str, limiter: RateLimiter) -> Optional[bytes]:
+        """Fetch a single page once the rate limiter grants a request slot.
+        
+        Empty content is reported as None, like a failed request.
+        """
+        limiter.acquire()
+        logger.info("Scraping page: %s", url)
+        return self.content_fetcher.fetch(url) or None
+    
+    def _scrape_page(self, page_number: int, limiter: RateLimiter) -> Optional[List[Product]]:
+        """Fetch and parse a page in the worker; None means the fetch failed."""
+        content = self._fetch_page(self._page_url(page_number), limiter)
+        if not content:
+            return None
+        return parse_page(self.product_parser, content, page_number)
+    
+    @staticmethod
+    def _in_page_order(
+        executor: ThreadPoolExecutor, job: Callable[[int], Any], total_pages: int, window: int
+    ) -> Iterator[Tuple[int, Any]]:
+        """Yield (page number, job result) in page order until a job returns nothing.
+        
+        At most `window` jobs are submitted ahead of the consumer. When the
+        consumer stops early, jobs that have not started are cancelled.
+        """
+        pending = deque()
+        next_page = 1
+        try:
+            while True:
+                while next_page <= total_pages and len(pending) < window:
+                    pending.append((next_page, executor.submit(job, next_page)))
+                    next_page += 1
+                if not pending:
+                    return
+                
+                page_number, future = pending.popleft()
+                result = future.result()
+                if result is None:
+                    logger.warning("Failed to fetch data from page %d, stopping scraping.", page_number)
+                    return
+                yield page_number, result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def iter_pages(self, **kwargs) -> Iterator[List[Product]]:
+        """Yield the products of each page, in page order, as soon as it is parsed.
+        
+        Pages are fetched and parsed by a pool of workers that runs at most
+        `max_workers` pages ahead of the consumer; closing the iterator early
+        cancels the fetches that have not started. Request starts are spaced `delay / max_workers`
+        seconds apart, so at most `max_workers` requests are issued per `delay`
+        window without a worker ever idling after its request. With
+        `parse_processes` set, pages are parsed in that many worker processes
+        instead; the product parser must then be picklable.
+        """
         total_pages = kwargs.get('total_pages', 50)
         delay = kwargs.get('delay', 2)
-        data = []
+        max_workers = kwargs.get('max_workers', PERFORMANCE_CONFIG['max_workers'])
+        parse_processes = kwargs.get('parse_processes', PERFORMANCE_CONFIG['parse_processes'])
+        limiter = RateLimiter(delay / max_workers)
         
-        for page_number in range(1, total_pages + 1):
-            url = BASE_URL if page_number == 1 else f"{BASE_URL}page{page_number}"
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if parse_processes:
+                pages = self._in_page_order(
+                    executor,
+                    lambda page_number: self._fetch_page(self._page_url(page_number), limiter),
+                    total_pages,
+                    max_workers
+                )
+                # Parsing holds the GIL, so spread it over processes as pages arrive;
+                # at most `parse_processes` pages wait to be parsed at a time
+                with ProcessPoolExecutor(max_workers=parse_processes) as pool, closing(pages):
+                    parsing = deque()
+                    for page_number, content in pages:
+                        parsing.append(pool.submit(parse_page, self.product_parser, content, page_number))
+                        if len(parsing) >= parse_processes:
+                            products = parsing.popleft().result()
+                            if products:
+                                yield products
+                    while parsing:
+                        products = parsing.popleft().result()
+                        if products:
+                            yield products
+                return
             
-            print(f"Scraping page: {url}")
-            content = self.content_fetcher.fetch(url)
-
-            if content:
-                try:
-                    soup = BeautifulSoup(content, "html.parser")
-                    cards = soup.find_all('div', class_='collection-card')
-                    
-                    if not cards:
-                        print(f"No products found on page {page_number}.")
-                        continue
-                    
-                    for card in cards:
-                        try:
-                            product = self.product_parser.parse(card)
-                            if product:
-                                data.append(product)
-                        except Exception as e:
-                            print(f"Error extracting product on page {page_number}: {e}")
-                    
-                    time.sleep(delay)
-                    
-                except Exception as e:
-                    print(f"Error parsing page {page_number}: {e}")
-                    continue
-            else:
-                print(f"Failed to fetch data from page {page_number}, stopping scraping.")
-                break
+            pages = self._in_page_order(
+                executor,
+                lambda page_number: self._scrape_page(page_number, limiter),
+                total_pages,
+                max_workers
+            )
+            # Closing the page generator first cancels queued fetches on early exit
+            with closing(pages):
+                for _, products in pages:
+                    if products:
+                        yield products
+    
+    def iter_extract(self, **kwargs) -> Iterator[Product]:
+        """Yield scraped products one at a time, in page order.
+        
+        Accepts the same options as iter_pages. Memory stays bounded by a few
+        pages: at most `max_workers` pages are fetched ahead of the consumer,
+        plus up to `parse_processes` pages waiting to be parsed.
+        """
+        for products in self.iter_pages(**kwargs):
+            yield from products
+    
+    def extract(self, **kwargs) -> List[Product]:
+        """Scrape fashion products from multiple pages concurrently."""
+        return list(self.iter_extract(**kwargs))
+
 
-        return data
+# Shared instances reused by the legacy function wrappers, so repeated calls keep
+# one HTTP session and one compiled-pattern cache
+_default_fetcher = HttpContentFetcher()
+_default_text_extractor = RegexTextExtractor()
+_default_product_parser = FashionProductParser(_default_text_extractor)
 
 
 # Legacy function wrappers for backward compatibility
 def fetching_content(url: str) -> Optional[bytes]:
     """Legacy wrapper for HttpContentFetcher."""
-    fetcher = HttpContentFetcher()
-    return fetcher.fetch(url)
+    return _default_fetcher.fetch(url)
 
 
 def extract_clean_text(info_list, keyword, pattern, default="N/A") -> str:
     """Legacy wrapper for RegexTextExtractor."""
-    extractor = RegexTextExtractor()
-    return extractor.extract_text(info_list, keyword, pattern, default)
+    return _default_text_extractor.extract_text(info_list, keyword, pattern, default)
 
 
-def extract_product_data(card) -> Optional[Dict[str, Any]]:
+def extract_product_data(card) -> Optional[Product]:
     """Legacy wrapper for FashionProductParser."""
-    text_extractor = RegexTextExtractor()
-    parser = FashionProductParser(text_extractor)
-    return parser.parse(card)
+    try:
+        return _default_product_parser.parse(card)
+    except Exception as e:
+        logger.warning("Error extracting product data: %s", e)
+        return None
 
 
-def scrape_fashion_products(total_pages: int, delay: int = 2) -> List[Dict[str, Any]]:
+def scrape_fashion_products(total_pages: int, delay: int = 2) -> List[Product]:
     """Legacy wrapper for FashionDataExtractor."""
-    content_fetcher = HttpContentFetcher()
-    text_extractor = RegexTextExtractor()
-    product_parser = FashionProductParser(text_extractor)
-    extractor = FashionDataExtractor(content_fetcher, product_parser)
+    extractor = FashionDataExtractor(_default_fetcher, _default_product_parser)
     
     return extractor.extract(total_pages=total_pages, delay=delay)
-
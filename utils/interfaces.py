@@ -4,15 +4,22 @@ This module defines abstract base classes for data extraction, transformation, a
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from re import Pattern
+from typing import List, Dict, Any, Optional, Union
 import pandas as pd
 
+from .config import EXTRACTION_KEYWORDS
+from .models import Product
+
 
 class DataExtractorInterface(ABC):
     """Interface for data extraction operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def extract(self, **kwargs) -> List[Dict[str, Any]]:
+    def extract(self, **kwargs) -> List[Any]:
         """Extract data from a source."""
         pass
 
@@ -20,6 +27,8 @@ class DataExtractorInterface(ABC):
 class DataTransformerInterface(ABC):
     """Interface for data transformation operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """Transform raw data into cleaned format."""
@@ -29,6 +38,8 @@ class DataTransformerInterface(ABC):
 class DataLoaderInterface(ABC):
     """Interface for data loading operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def load(self, data: pd.DataFrame, **kwargs) -> bool:
         """Load data to a destination."""
@@ -38,6 +49,8 @@ class DataLoaderInterface(ABC):
 class ContentFetcherInterface(ABC):
     """Interface for fetching content from web sources."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def fetch(self, url: str) -> Optional[bytes]:
         """Fetch content from a URL."""
@@ -47,16 +60,39 @@ class ContentFetcherInterface(ABC):
 class ProductParserInterface(ABC):
     """Interface for parsing product data from HTML."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def parse(self, html_element) -> Optional[Dict[str, Any]]:
-        """Parse product data from HTML element."""
+    def parse(self, html_element, timestamp: Optional[datetime] = None) -> Optional[Product]:
+        """Parse product data from HTML element, stamped with timestamp (default: now)."""
         pass
 
 
 class TextExtractorInterface(ABC):
     """Interface for extracting text using patterns."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def extract_text(self, elements: List, keyword: str, pattern: str, default: str = "N/A") -> str:
+    def extract_text(self, elements: List, keyword: str, pattern: Union[str, Pattern], default: str = "N/A") -> str:
         """Extract text based on keyword and pattern."""
         pass
+    
+    def extract_fields(
+        self,
+        elements: List,
+        patterns: Dict[str, Union[str, Pattern]],
+        defaults: Dict[str, str],
+        keywords: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Extract several named fields from the elements.
+        
+        The default calls ``extract_text`` once per field; implementations
+        may override it to find every field in a single pass, returning the
+        same stripped values.
+        """
+        keywords = keywords or EXTRACTION_KEYWORDS
+        return {
+            name: self.extract_text(elements, keywords[name], pattern, defaults[name])
+            for name, pattern in patterns.items()
+        }
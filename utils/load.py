@@ -3,39 +3,161 @@ Data loading module implementing SOLID principles.
 Contains concrete implementations for various data storage destinations.
 """
 
+import io
 import pandas as pd
 import os
-from typing import Optional, Dict, Any
-from sqlalchemy import create_engine
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, Tuple
 
 from .interfaces import DataLoaderInterface
 from .config import (
     DATABASE_CONFIG, 
     GOOGLE_SHEETS_CONFIG, 
     FILE_CONFIG,
+    TIMESTAMP_FORMAT,
     get_database_config
 )
 
-# Load environment variables
-load_dotenv()
+
+@lru_cache(maxsize=4)
+def _get_sheets_service(credential_file: str, scopes: Tuple[str, ...]):
+    """Parse service-account credentials and build the Sheets client once per key file."""
+    # The Google SDKs and orjson are only needed by this destination
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+    from .sheets_model import OrjsonModel
+    
+    creds = Credentials.from_service_account_file(credential_file, scopes=list(scopes))
+    # The discovery document bundled with the client is used, so building the
+    # service needs no HTTP request and no discovery cache on disk
+    return build(
+        'sheets', 'v4',
+        credentials=creds,
+        model=OrjsonModel(),
+        static_discovery=True,
+        cache_discovery=False
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_engine(url: str):
+    """Create the engine for url once, so every load reuses its connection pool.
+    
+    psycopg2 engines batch executemany calls and check pooled connections
+    before use.
+    """
+    from sqlalchemy import create_engine
+    
+    options = {
+        'insertmanyvalues_page_size': DATABASE_CONFIG['insertmanyvalues_page_size'],
+        'pool_pre_ping': True
+    }
+    if url.startswith('postgresql+psycopg2://'):
+        options['pool_size'] = DATABASE_CONFIG['pool_size']
+        options['executemany_mode'] = 'values_plus_batch'
+        options['executemany_batch_page_size'] = DATABASE_CONFIG['executemany_batch_page_size']
+    return create_engine(url, **options)
 
 
 class CsvDataLoader(DataLoaderInterface):
     """Concrete implementation for CSV file loading."""
     
+    # Filename endings for which pandas infers a compressed output
+    COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.zip', '.xz', '.zst', '.tar')
+    
     def load(self, data: pd.DataFrame, **kwargs) -> bool:
-        """Save DataFrame to CSV file."""
+        """Save DataFrame to CSV file, formatting `chunksize` rows at a time.
+        
+        Compression is inferred from the filename (e.g. ``.csv.gz``) unless
+        given explicitly. Pass ``mode='a'`` and ``header=False`` to append a batch.
+        Uncompressed output goes through one large write buffer, and a full
+        rewrite is written to ``<filename>.tmp`` first and then moved over the
+        target, so readers never see a half-written file.
+        With ``engine='pyarrow'``, uncompressed files are written by Arrow's
+        multithreaded writer, which quotes every string, writes whole floats
+        without a decimal point and timestamps in Arrow's own ISO form; pandas
+        is used when pyarrow is not installed.
+        """
         filename = kwargs.get('filename', FILE_CONFIG['default_csv_filename'])
+        chunksize = kwargs.get('chunksize', FILE_CONFIG['csv_chunksize'])
+        compression = kwargs.get('compression', 'infer')
+        mode = kwargs.get('mode', 'w')
+        header = kwargs.get('header', True)
+        engine = kwargs.get('engine', FILE_CONFIG['csv_engine'])
         try:
-            data.to_csv(filename, index=False)
+            uncompressed = compression is None or (
+                compression == 'infer' and not str(filename).endswith(self.COMPRESSED_SUFFIXES)
+            )
+            if uncompressed:
+                self._write_buffered(data, str(filename), mode, header, chunksize, engine)
+            else:
+                data.to_csv(
+                    filename,
+                    index=False,
+                    mode=mode,
+                    header=header,
+                    chunksize=chunksize,
+                    compression=compression,
+                    date_format=TIMESTAMP_FORMAT
+                )
             print(f"[Flatfile-.CSV] Data successfully saved to {filename}")
             return True
         except Exception as e:
             print(f"[CSV Error] Failed to save data to CSV: {e}")
             return False
+    
+    def _write_buffered(
+        self, data: pd.DataFrame, filename: str, mode: str, header: bool, chunksize: int, engine: str
+    ) -> None:
+        """Write uncompressed CSV through one large buffer, atomically for mode 'w'."""
+        target = f"{filename}.tmp" if mode == 'w' else filename
+        try:
+            with open(target, mode + 'b', buffering=FILE_CONFIG['csv_buffer_size']) as output:
+                if not (engine == 'pyarrow' and self._write_pyarrow(data, output, header)):
+                    data.to_csv(
+                        output,
+                        index=False,
+                        header=header,
+                        chunksize=chunksize,
+                        date_format=TIMESTAMP_FORMAT
+                    )
+            if target != filename:
+                os.replace(target, filename)
+        except BaseException:
+            # Leave an existing file untouched rather than half replaced
+            if target != filename and os.path.exists(target):
+                os.remove(target)
+            raise
+    
+    @staticmethod
+    def _write_pyarrow(data: pd.DataFrame, output, header: bool) -> bool:
+        """Write with pyarrow's CSV writer; returns False if pyarrow is unavailable."""
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            return False
+        
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        pa_csv.write_csv(table, output, pa_csv.WriteOptions(include_header=header))
+        return True
+
+
+class ParquetDataLoader(DataLoaderInterface):
+    """Concrete implementation for Parquet file loading."""
+    
+    def load(self, data: pd.DataFrame, **kwargs) -> bool:
+        """Save DataFrame to a columnar Parquet file (requires pyarrow)."""
+        filename = kwargs.get('filename', FILE_CONFIG['default_parquet_filename'])
+        compression = kwargs.get('compression', FILE_CONFIG['parquet_compression'])
+        try:
+            data.to_parquet(filename, engine='pyarrow', compression=compression, index=False)
+            print(f"[Flatfile-.Parquet] Data successfully saved to {filename}")
+            return True
+        except Exception as e:
+            print(f"[Parquet Error] Failed to save data to Parquet: {e}")
+            return False
 
 
 class PostgreSQLDataLoader(DataLoaderInterface):
@@ -45,20 +167,47 @@ class PostgreSQLDataLoader(DataLoaderInterface):
         self.default_config = DATABASE_CONFIG
     
     def load(self, data: pd.DataFrame, **kwargs) -> bool:
-        """Save DataFrame to PostgreSQL database."""
+        """Save DataFrame to PostgreSQL database.
+        
+        Rows are streamed with COPY FROM STDIN unless ``use_copy=False``, in
+        which case psycopg2's ``execute_values`` sends `chunksize` rows per
+        INSERT. A full SQLAlchemy ``url`` may be given instead of the
+        connection parts; databases other than PostgreSQL are then written
+        with ``to_sql``.
+        """
+        url = kwargs.get('url')
         db_name = kwargs.get('db_name')
         user = kwargs.get('user')
         password = kwargs.get('password')
         host = kwargs.get('host', self.default_config['default_host'])
         port = kwargs.get('port', self.default_config['default_port'])
         table_name = kwargs.get('table_name', self.default_config['default_table'])
+        use_copy = kwargs.get('use_copy', True)
         
         try:
-            data_for_sql = data.copy()
-            data_for_sql.columns = [col.lower() for col in data_for_sql.columns]
+            # Only the labels change, so the renamed frame shares the caller's data
+            data_for_sql = data.rename(columns=str.lower, copy=False)
             
-            engine = create_engine(f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}')
-            data_for_sql.to_sql(table_name, engine, index=False, if_exists='append')
+            engine = _get_engine(url or f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}')
+            chunksize = kwargs.get('chunksize', self.default_config['to_sql_chunksize'])
+            if use_copy and engine.dialect.name == 'postgresql':
+                # Create the table from the frame's schema if needed, then stream the rows
+                data_for_sql.head(0).to_sql(table_name, engine, index=False, if_exists='append')
+                self._copy_rows(data_for_sql, table_name, engine)
+            elif engine.dialect.name == 'postgresql' and engine.dialect.driver == 'psycopg2':
+                # Multi-row INSERT statements formatted by psycopg2 itself
+                data_for_sql.head(0).to_sql(table_name, engine, index=False, if_exists='append')
+                self._insert_values(data_for_sql, table_name, engine, chunksize)
+            else:
+                # Multi-row INSERT statements, one per chunk of rows
+                data_for_sql.to_sql(
+                    table_name,
+                    engine,
+                    index=False,
+                    if_exists='append',
+                    method='multi',
+                    chunksize=chunksize
+                )
             print(f"[PostgreSQL] Data successfully saved to table {table_name}.")
             return True
         except Exception as e:
@@ -66,6 +215,56 @@ class PostgreSQLDataLoader(DataLoaderInterface):
             return False
 
 
+    @staticmethod
+    def _copy_rows(data: pd.DataFrame, table_name: str, engine) -> None:
+        """Bulk insert rows with PostgreSQL COPY, fed from an in-memory CSV buffer.
+        
+        Missing values are written as \\N so that they load as NULL while
+        empty strings stay empty strings.
+        """
+        buffer = io.StringIO()
+        data.to_csv(buffer, index=False, header=False, na_rep='\\N')
+        buffer.seek(0)
+        
+        columns = ', '.join(data.columns)
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer
+                )
+            connection.commit()
+        finally:
+            connection.close()
+    
+    @staticmethod
+    def _insert_values(data: pd.DataFrame, table_name: str, engine, page_size: int) -> None:
+        """Insert rows with psycopg2's execute_values, `page_size` rows per statement."""
+        from psycopg2.extras import execute_values
+        
+        # Rows are built from native column values; missing values become NULL
+        columns = []
+        for column in data.columns:
+            series = data[column]
+            if series.hasnans:
+                series = series.astype(object).where(series.notna(), None)
+            columns.append(series.tolist())
+        rows = list(zip(*columns))
+        
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    f"INSERT INTO {table_name} ({', '.join(data.columns)}) VALUES %s",
+                    rows,
+                    page_size=page_size
+                )
+            connection.commit()
+        finally:
+            connection.close()
+
+
 class GoogleSheetsDataLoader(DataLoaderInterface):
     """Concrete implementation for Google Sheets loading."""
     
@@ -73,56 +272,182 @@ class GoogleSheetsDataLoader(DataLoaderInterface):
         self.scopes = GOOGLE_SHEETS_CONFIG['scopes']
     
     def load(self, data: pd.DataFrame, **kwargs) -> bool:
-        """Save DataFrame to Google Spreadsheet."""
+        """Save DataFrame to Google Spreadsheet.
+        
+        Further frames can be passed as ``ranges={range_name: DataFrame}``;
+        all ranges are cleared in one request and written in another, so the
+        number of round trips does not grow with the number of ranges.
+        """
         spreadsheet_id = kwargs.get('spreadsheet_id')
         range_name = kwargs.get('range_name')
         credential_file = kwargs.get('credential_file', GOOGLE_SHEETS_CONFIG['default_credentials_file'])
+        # Skip the extra round trip when the new data is known to cover the old range
+        clear_existing = kwargs.get('clear', True)
+        frames = {range_name: data, **kwargs.get('ranges', {})}
         
         try:
-            creds = Credentials.from_service_account_file(credential_file, scopes=self.scopes)
-            service = build('sheets', 'v4', credentials=creds)
+            service = _get_sheets_service(credential_file, tuple(self.scopes))
+            values_api = service.spreadsheets().values()
 
             # Clear existing data
-            service.spreadsheets().values().clear(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-            ).execute()
-
-            # Format data
-            values = [data.columns.tolist()] + data.values.tolist()
-            body = {'values': values}
-
-            # Update spreadsheet
-            service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption="RAW",
-                body=body
-            ).execute()
+            if clear_existing:
+                values_api.batchClear(
+                    spreadsheetId=spreadsheet_id,
+                    body={'ranges': list(frames)},
+                ).execute()
+
+            body = {
+                'valueInputOption': "RAW",
+                'data': [
+                    {'range': name, 'majorDimension': "ROWS", 'values': self._to_values(frame)}
+                    for name, frame in frames.items()
+                ]
+            }
+
+            # Update every range in a single request
+            values_api.batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
 
             print(f"[Google Sheets] Data successfully saved to Spreadsheet (Fashion Data Processing).")
             return True
         except Exception as e:
             print(f"[Google Sheets Error] Failed to save to Google Sheets: {e}")
             return False
+    
+    @staticmethod
+    def _to_values(data: pd.DataFrame) -> list:
+        """Return the header and rows of a frame as lists of native Python values."""
+        # Format data column by column so each dtype unboxes to native Python values;
+        # timestamps are sent as ISO strings
+        columns = []
+        for column in data.columns:
+            series = data[column]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                series = series.dt.strftime(TIMESTAMP_FORMAT)
+            columns.append(series.tolist())
+        return [data.columns.tolist()] + [list(row) for row in zip(*columns)]
 
 
 class MultiDestinationDataLoader:
     """Orchestrates loading to multiple destinations."""
     
-    def __init__(self):
-        self.csv_loader = CsvDataLoader()
-        self.postgres_loader = PostgreSQLDataLoader()
-        self.sheets_loader = GoogleSheetsDataLoader()
+    # Every known destination; Parquet is still only written when given a filename
+    DESTINATIONS = frozenset({'csv', 'parquet', 'postgresql', 'google_sheets'})
+    
+    def __init__(self, enabled: Optional[Iterable[str]] = None):
+        """Build loaders for the ``enabled`` destinations only (all by default).
+        
+        Disabled destinations are never called and are reported as ``None``.
+        """
+        self.enabled = self.DESTINATIONS if enabled is None else frozenset(enabled)
+        unknown = self.enabled - self.DESTINATIONS
+        if unknown:
+            raise ValueError(f"Unknown destinations: {', '.join(sorted(unknown))}")
+        
+        self.csv_loader = CsvDataLoader() if 'csv' in self.enabled else None
+        self.parquet_loader = ParquetDataLoader() if 'parquet' in self.enabled else None
+        self.postgres_loader = PostgreSQLDataLoader() if 'postgresql' in self.enabled else None
+        self.sheets_loader = GoogleSheetsDataLoader() if 'google_sheets' in self.enabled else None
     
     def load_to_all(
         self,
         data: pd.DataFrame,
         filename_csv: Optional[str] = None,
         db_config: Optional[Dict[str, Any]] = None,
+        sheets_config: Optional[Dict[str, Any]] = None,
+        filename_parquet: Optional[str] = None
+    ) -> Dict[str, Optional[bool]]:
+        """Load data to all enabled storage destinations.
+        
+        A Parquet copy is written as well when ``filename_parquet`` is given.
+        """
+        filename_csv, db_config, sheets_config = self._resolve_configs(
+            filename_csv, db_config, sheets_config
+        )
+        
+        destinations = {
+            'csv': (self.csv_loader, {'filename': filename_csv}),
+            'postgresql': (self.postgres_loader, db_config),
+            'google_sheets': (self.sheets_loader, sheets_config)
+        }
+        if filename_parquet:
+            destinations['parquet'] = (self.parquet_loader, {'filename': filename_parquet})
+        
+        results: Dict[str, Optional[bool]] = {name: None for name in destinations}
+        active = {name: job for name, job in destinations.items() if job[0] is not None}
+        if not active:
+            return results
+        
+        # Destinations are independent and I/O-bound, so load them concurrently
+        with ThreadPoolExecutor(max_workers=len(active)) as executor:
+            futures = {
+                name: executor.submit(loader.load, data, **kwargs)
+                for name, (loader, kwargs) in active.items()
+            }
+            results.update((name, future.result()) for name, future in futures.items())
+        
+        return results
+    
+    def load_batches(
+        self,
+        batches: Iterable[pd.DataFrame],
+        filename_csv: Optional[str] = None,
+        db_config: Optional[Dict[str, Any]] = None,
         sheets_config: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, bool]:
-        """Load data to all storage destinations."""
+    ) -> Dict[str, Optional[bool]]:
+        """Load data batch by batch as it is produced.
+        
+        Each batch is appended to the CSV file and the PostgreSQL table right
+        away. Google Sheets overwrites its range, so it is written once with
+        every loaded row after the last batch. Disabled destinations are
+        reported as ``None``. Returns an empty dict when no batch was produced.
+        """
+        filename_csv, db_config, sheets_config = self._resolve_configs(
+            filename_csv, db_config, sheets_config
+        )
+        
+        results: Dict[str, Optional[bool]] = {
+            'csv': True if self.csv_loader else None,
+            'postgresql': True if self.postgres_loader else None
+        }
+        loaded = []
+        # Both appends of a batch run concurrently; waiting for them before the
+        # next batch keeps the CSV rows in order
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for batch in batches:
+                first_batch = not loaded
+                futures = {}
+                if self.csv_loader:
+                    futures['csv'] = executor.submit(
+                        self.csv_loader.load,
+                        batch,
+                        filename=filename_csv,
+                        mode='w' if first_batch else 'a',
+                        header=first_batch
+                    )
+                if self.postgres_loader:
+                    futures['postgresql'] = executor.submit(self.postgres_loader.load, batch, **db_config)
+                for name, future in futures.items():
+                    results[name] = future.result() and results[name]
+                # Rows are only kept when Google Sheets still has to be written
+                loaded.append(batch if self.sheets_loader else batch.head(0))
+        
+        if not loaded:
+            return {}
+        
+        results['google_sheets'] = None
+        if self.sheets_loader:
+            results['google_sheets'] = self.sheets_loader.load(
+                pd.concat(loaded, ignore_index=True), **sheets_config
+            )
+        return results
+    
+    @staticmethod
+    def _resolve_configs(
+        filename_csv: Optional[str],
+        db_config: Optional[Dict[str, Any]],
+        sheets_config: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        """Fill in default destination settings for anything not provided."""
         
         # Use default filename if not provided
         if filename_csv is None:
@@ -140,20 +465,20 @@ class MultiDestinationDataLoader:
         db_config = {**default_db_config, **(db_config or {})}
         sheets_config = {**default_sheets_config, **(sheets_config or {})}
         
-        # Load to all destinations
-        results = {}
-        results['csv'] = self.csv_loader.load(data, filename=filename_csv)
-        results['postgresql'] = self.postgres_loader.load(data, **db_config)
-        results['google_sheets'] = self.sheets_loader.load(data, **sheets_config)
-        
-        return results
+        return filename_csv, db_config, sheets_config
+
+
+# Shared instances reused by the legacy function wrappers
+_default_csv_loader = CsvDataLoader()
+_default_postgres_loader = PostgreSQLDataLoader()
+_default_sheets_loader = GoogleSheetsDataLoader()
+_default_multi_loader = MultiDestinationDataLoader()
 
 
 # Legacy function wrappers for backward compatibility
 def save_to_csv(df: pd.DataFrame, filename: str = 'fashion_data.csv') -> None:
     """Legacy wrapper for CsvDataLoader."""
-    loader = CsvDataLoader()
-    loader.load(df, filename=filename)
+    _default_csv_loader.load(df, filename=filename)
 
 
 def save_to_postgresql(
@@ -166,8 +491,7 @@ def save_to_postgresql(
     table_name: str = 'fashion_products'
 ) -> None:
     """Legacy wrapper for PostgreSQLDataLoader."""
-    loader = PostgreSQLDataLoader()
-    loader.load(
+    _default_postgres_loader.load(
         df,
         db_name=db_name,
         user=user,
@@ -185,8 +509,7 @@ def save_to_google_spreadsheet(
     credential_file: str = 'client_secret.json'
 ) -> None:
     """Legacy wrapper for GoogleSheetsDataLoader."""
-    loader = GoogleSheetsDataLoader()
-    loader.load(
+    _default_sheets_loader.load(
         df,
         spreadsheet_id=spreadsheet_id,
         range_name=range_name,
@@ -206,8 +529,6 @@ def load_data(
     range_name: str = 'Sheet1!A1'
 ) -> None:
     """Legacy wrapper for MultiDestinationDataLoader."""
-    loader = MultiDestinationDataLoader()
-    
     # Prepare configurations
     db_config = None
     if any([db_name, user, password, host, port]):
@@ -226,4 +547,4 @@ def load_data(
             'range_name': range_name
         }
     
-    loader.load_to_all(df, filename_csv, db_config, sheets_config)
+    _default_multi_loader.load_to_all(df, filename_csv, db_config, sheets_config)
@@ -0,0 +1,29 @@
+"""
+Data models for the ETL pipeline.
+Defines the fixed-schema records passed between pipeline stages.
+"""
+
+from datetime import datetime
+from typing import Any, NamedTuple
+
+
+class Product(NamedTuple):
+    """Raw attributes of one scraped product card, in PRODUCT_COLUMNS order.
+    
+    Being a tuple, a product is already a record that
+    ``pd.DataFrame.from_records`` can consume without conversion.
+    """
+    
+    Title: str
+    Price: str
+    Rating: str
+    Colors: str
+    Size: str
+    Gender: str
+    Timestamp: datetime
+    
+    def __getitem__(self, key: Any) -> Any:
+        """Support dict-style access (product['Title']) for backward compatibility."""
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
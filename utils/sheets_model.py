@@ -0,0 +1,16 @@
+"""
+Google Sheets request model.
+Kept apart from the load module so the Google SDK is only imported when Sheets is used.
+"""
+
+import orjson
+from googleapiclient.model import JsonModel
+
+
+class OrjsonModel(JsonModel):
+    """Sheets request model that serializes JSON bodies with orjson."""
+    
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        return orjson.dumps(body_value, option=orjson.OPT_SERIALIZE_NUMPY)
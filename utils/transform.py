@@ -3,22 +3,56 @@ Data transformation module implementing SOLID principles.
 Contains concrete implementations for data cleaning and transformation.
 """
 
+import re
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional
 
 from .interfaces import DataTransformerInterface
-from .config import TRANSFORMATION_CONFIG
+from .config import (
+    TRANSFORMATION_CONFIG,
+    RATING_VALUE_PATTERN,
+    COLORS_COUNT_PATTERN,
+    PRICE_AMOUNT_PATTERN
+)
+
+
+def _extract_number(values: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Return the ``value`` group of pattern as float64, NaN where it does not match.
+    
+    Runs the pyarrow regex kernel over the whole column when pyarrow is
+    installed and falls back to pandas' per-row ``str.extract`` otherwise.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return values.str.extract(pattern, expand=False).astype(float).rename(values.name)
+    
+    matches = pc.extract_regex(pa.array(values, type=pa.string(), from_pandas=True), pattern.pattern)
+    numbers = pc.struct_field(matches, [0]).cast(pa.float64())
+    return pd.Series(
+        numbers.to_numpy(zero_copy_only=False, writable=True), index=values.index, name=values.name
+    )
 
 
 class RatingCleaner:
     """Single responsibility: Clean rating data."""
     
     @staticmethod
-    def clean(df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and convert rating column to float."""
-        df = df[df['Rating'] != 'Invalid Rating'].copy()
-        df['Rating'] = df['Rating'].str.extract(r'⭐\s*(\d+\.\d+)')
-        df['Rating'] = df['Rating'].astype(float)
+    def convert(ratings: pd.Series) -> pd.Series:
+        """Return ratings as floats, NaN where no rating can be parsed."""
+        return _extract_number(ratings, RATING_VALUE_PATTERN)
+    
+    @classmethod
+    def clean(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and convert rating column to float, dropping unparsable ratings."""
+        ratings = cls.convert(df['Rating'])
+        valid = ratings.notna()
+        if not valid.all():
+            df = df[valid].copy()
+            ratings = ratings[valid]
+        df['Rating'] = ratings
         return df
 
 
@@ -29,11 +63,47 @@ class PriceCleaner:
         self.usd_to_idr_rate = usd_to_idr_rate or TRANSFORMATION_CONFIG["usd_to_idr_rate"]
         self.decimal_places = decimal_places or TRANSFORMATION_CONFIG["price_decimal_places"]
     
+    @staticmethod
+    def _parse_amounts(prices: pd.Series) -> np.ndarray:
+        """Return the USD amounts of price strings as a writable float64 array.
+        
+        Thousands separators are dropped and the rest must match
+        ``PRICE_AMOUNT_PATTERN``, so signed, exponent or padded values are
+        rejected on every backend. With pyarrow installed this runs in Arrow
+        kernels over the whole column; otherwise pandas' string methods are used.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            return (
+                prices.str.replace(',', '', regex=False)
+                .str.extract(PRICE_AMOUNT_PATTERN, expand=False)
+                .to_numpy(dtype=np.float64, copy=True)
+            )
+        
+        strings = pc.replace_substring(pa.array(prices, type=pa.string(), from_pandas=True), ',', '')
+        matches = pc.extract_regex(strings, PRICE_AMOUNT_PATTERN.pattern)
+        amounts = pc.struct_field(matches, [0]).cast(pa.float64())
+        return amounts.to_numpy(zero_copy_only=False, writable=True)
+    
+    def convert(self, prices: pd.Series) -> pd.Series:
+        """Return prices converted to IDR, NaN where no amount can be parsed."""
+        amounts = self._parse_amounts(prices)
+        
+        # Convert and round in place on the raw array, without intermediate Series
+        np.multiply(amounts, self.usd_to_idr_rate, out=amounts)
+        np.round(amounts, self.decimal_places, out=amounts)
+        return pd.Series(amounts, index=prices.index, name=prices.name)
+    
     def clean(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and convert price column to IDR."""
-        df['Price'] = df['Price'].str.replace('$', '', regex=False).str.replace(',', '', regex=False)
-        df['Price'] = df['Price'].astype(float) * self.usd_to_idr_rate
-        df['Price'] = df['Price'].round(self.decimal_places).astype('float64')
+        """Clean and convert price column to IDR, dropping unparsable prices."""
+        prices = self.convert(df['Price'])
+        valid = prices.notna()
+        if not valid.all():
+            df = df[valid].copy()
+            prices = prices[valid]
+        df['Price'] = prices
         return df
 
 
@@ -41,9 +111,20 @@ class ColorsCleaner:
     """Single responsibility: Clean colors data."""
     
     @staticmethod
-    def clean(df: pd.DataFrame) -> pd.DataFrame:
-        """Convert colors column to integer."""
-        df['Colors'] = df['Colors'].str.extract(r'(\d+)').astype(int)
+    def convert(colors: pd.Series) -> pd.Series:
+        """Return each color count as a float, NaN where there is none."""
+        return _extract_number(colors, COLORS_COUNT_PATTERN)
+    
+    @classmethod
+    def clean(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert colors column to int32, dropping rows without a color count."""
+        colors = cls.convert(df['Colors'])
+        valid = colors.notna()
+        if not valid.all():
+            df = df[valid].copy()
+            colors = colors[valid]
+        # Only whole numbers are extracted, so the float counts cast exactly
+        df['Colors'] = colors.astype('int32')
         return df
 
 
@@ -51,10 +132,36 @@ class AttributeCleaner:
     """Single responsibility: Clean string attributes."""
     
     @staticmethod
-    def clean(df: pd.DataFrame) -> pd.DataFrame:
-        """Convert Size and Gender columns to string."""
-        df['Size'] = df['Size'].astype(str)
-        df['Gender'] = df['Gender'].astype(str)
+    def convert(values: pd.Series) -> pd.Series:
+        """Return an attribute column as categorical strings.
+        
+        Missing values stay missing rather than becoming the strings "None"
+        or "nan", so they load as NULL, like the Polars backend's nulls.
+        """
+        # Categorize first so only the distinct labels are converted to str;
+        # labels left over from already categorical input are dropped
+        categories = values.astype('category').cat.remove_unused_categories()
+        labels = categories.cat.categories.astype(str)
+        if labels.is_unique:
+            return categories.cat.rename_categories(labels)
+        
+        # Mixed labels such as 1 and "1" become equal as strings, so their codes are merged
+        merged = labels.unique()
+        codes = categories.cat.codes.to_numpy()
+        codes = np.where(codes >= 0, merged.get_indexer(labels)[codes], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, merged), index=values.index, name=values.name
+        )
+    
+    @classmethod
+    def clean(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert Size and Gender columns to categorical strings.
+        
+        Both have only a handful of distinct values, so each row stores a
+        small code into one shared set of labels.
+        """
+        df['Size'] = cls.convert(df['Size'])
+        df['Gender'] = cls.convert(df['Gender'])
         return df
 
 
@@ -62,39 +169,119 @@ class TimestampCleaner:
     """Single responsibility: Clean timestamp data."""
     
     @staticmethod
-    def clean(df: pd.DataFrame) -> pd.DataFrame:
-        """Format timestamp to ISO format."""
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce').dt.strftime('%Y-%m-%dT%H:%M:%S.%f')
+    def convert(timestamps: pd.Series) -> pd.Series:
+        """Return timestamps as datetime64 values, NaT where they cannot be parsed.
+        
+        Products of a page share one timestamp, so each distinct value is
+        parsed only once (``cache=True``) with the fixed ISO 8601 parser.
+        Sinks that store text format the column themselves.
+        """
+        return pd.to_datetime(timestamps, errors='coerce', format='ISO8601', cache=True)
+    
+    @classmethod
+    def clean(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse the timestamp column into datetime64 values."""
+        df['Timestamp'] = cls.convert(df['Timestamp'])
+        return df
+
+
+class DtypeOptimizer:
+    """Single responsibility: Shrink column dtypes of cleaned data."""
+    
+    UNSIGNED_COLUMNS = ('Colors',)
+    
+    @classmethod
+    def optimize(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast non-negative counts to the smallest unsigned integer type."""
+        for column in cls.UNSIGNED_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], downcast='unsigned')
         return df
 
 
 class FashionDataTransformer(DataTransformerInterface):
     """Concrete implementation for fashion data transformation."""
     
-    def __init__(self):
+    # Columns the cleaners always replace with newly allocated arrays; parsing
+    # timestamps that are already datetime64 may return the input unchanged
+    CONVERTED_COLUMNS = frozenset({'Rating', 'Price', 'Colors', 'Size', 'Gender'})
+    
+    def __init__(self, backend: Optional[str] = None):
         self.rating_cleaner = RatingCleaner()
         self.price_cleaner = PriceCleaner()
         self.colors_cleaner = ColorsCleaner()
         self.attribute_cleaner = AttributeCleaner()
         self.timestamp_cleaner = TimestampCleaner()
+        self.backend = backend or TRANSFORMATION_CONFIG["backend"]
     
     def transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """Transform raw data into cleaned format."""
         try:
-            df = data.copy()
+            if self.backend == "polars":
+                return self._transform_polars(data)
             
-            # Apply cleaning operations in sequence
-            df = self.rating_cleaner.clean(df)
-            df = self.price_cleaner.clean(df)
-            df = self.colors_cleaner.clean(df)
-            df = self.attribute_cleaner.clean(df)
-            df = self.timestamp_cleaner.clean(df)
+            # Parse the validated columns first and filter all invalid rows at once
+            ratings = self.rating_cleaner.convert(data['Rating'])
+            prices = self.price_cleaner.convert(data['Price'])
+            colors = self.colors_cleaner.convert(data['Colors'])
+            valid = ratings.notna() & prices.notna() & colors.notna()
+            keep_all = valid.all()
             
-            return df
+            # Filter column by column, skipping the raw columns already parsed,
+            # and assemble the result from the converted arrays
+            columns = {
+                name: data[name] if keep_all else data[name][valid]
+                for name in data.columns if name not in ('Rating', 'Price', 'Colors')
+            }
+            if not keep_all:
+                ratings, prices, colors = ratings[valid], prices[valid], colors[valid]
+            columns.update(
+                Rating=ratings,
+                Price=prices,
+                Colors=colors.astype('int32'),
+                Size=self.attribute_cleaner.convert(columns['Size']),
+                Gender=self.attribute_cleaner.convert(columns['Gender']),
+                Timestamp=self.timestamp_cleaner.convert(columns['Timestamp'])
+            )
+            if keep_all:
+                # Other columns (Title, Timestamp and any extras) may still share
+                # the input's arrays, so only those are copied
+                for name in data.columns:
+                    if name not in self.CONVERTED_COLUMNS:
+                        columns[name] = columns[name].copy()
+            return pd.DataFrame({name: columns[name] for name in data.columns}, copy=False)
             
         except Exception as e:
             print(f"[Transform Error] Error during data transformation: {e}")
             return pd.DataFrame()
+    
+    def _transform_polars(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Run every cleaner as one Polars expression batch.
+        
+        Produces the same columns and dtypes as the pandas cleaners; the
+        result has a fresh RangeIndex. Requires the optional ``polars``
+        package (and ``pyarrow`` for the pandas conversions).
+        """
+        import polars as pl
+        
+        frame = pl.from_pandas(data)
+        timestamp = pl.col('Timestamp')
+        if frame.schema['Timestamp'] == pl.String:
+            timestamp = timestamp.str.to_datetime(strict=False)
+        
+        cleaned = frame.with_columns(
+            pl.col('Rating').str.extract(RATING_VALUE_PATTERN.pattern, 1).cast(pl.Float64),
+            (
+                pl.col('Price').str.replace_all(',', '', literal=True)
+                .str.extract(PRICE_AMOUNT_PATTERN.pattern, 1)
+                .cast(pl.Float64) * self.price_cleaner.usd_to_idr_rate
+            ).round(self.price_cleaner.decimal_places),
+            pl.col('Colors').str.extract(COLORS_COUNT_PATTERN.pattern, 1).cast(pl.Int32),
+            pl.col('Size', 'Gender').cast(pl.String).cast(pl.Categorical),
+            timestamp.cast(pl.Datetime('ns'))
+        ).drop_nulls(['Rating', 'Price', 'Colors'])
+        
+        return cleaned.to_pandas()
 
 
 # Legacy function wrapper for backward compatibility